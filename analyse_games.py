@@ -0,0 +1,29 @@
+from app.classes.game_analysis import GameAnalysis
+import argparse
+
+
+def print_summary(summary):
+    """
+    Prints totals of analysed games per player type.
+    :param summary: (dict) of totals returned by GameAnalysis.run().
+    """
+    print('Games analysed: {} ({} with errors)'.format(summary['games'], summary['errors']))
+    print('{:<12}{:>10}{:>10}{:>10}{:>10}'.format('PLAYER', 'MOVES', 'ACCURACY', 'BLUNDERS', 'AVG LOSS'))
+    for player_type, totals in sorted(summary['players'].items()):
+        print('{:<12}{:>10}{:>10.3f}{:>10}{:>10.1f}'.format(player_type, totals['moves'], totals['accuracy'],
+                                                            totals['blunders'], totals['avg_loss']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Analyses archived games: accuracy and blunders per player type.')
+    parser.add_argument('archive', help='archive file - a JSON game record per line')
+    parser.add_argument('report', help='report file - a JSON game report per line is appended')
+    parser.add_argument('--checkpoint', default=None, help='checkpoint file to resume from (default: report file + '
+                                                           '.checkpoint)')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes to split games between')
+    parser.add_argument('--cache', default=None, help='position cache file to start workers\' caches from and merge '
+                                                      'their positions into (default: report file + .cache)')
+    parser.add_argument('--max-games', type=int, default=None, help='max games to analyse in this run')
+    args = parser.parse_args()
+    print_summary(GameAnalysis(args.archive, args.report, args.checkpoint, args.workers, args.cache)
+                  .run(args.max_games))
@@ -1,5 +1,10 @@
 from ..data import game_data as data
+from .eval_cache import EvalCache
+from .game import Game
+from .board import Board
+from .search import Search
 import random
+import time
 
 
 class AI:
@@ -7,15 +12,29 @@ class AI:
     This classes creates the Artificial intelligence of the game: automatic choosing of the optimal move if any.
     """
 
-    def __init__(self, game, player):
+    def __init__(self, game, player, cache=None, seed=None, depth=1, move_order=None, time_manager=None):
         """
-        Init method for AI objects: Assigns Game object, this player number (1-2) and last found move var.
+        Init method for AI objects: Assigns Game object, this player number (1-2), last found move var,
+        evaluation cache and random generator.
         :param game: (Game) object with this game logic.
         :param player: (int) in range (1-2) containing player number.
+        :param cache: (EvalCache) object to store position scores in. default=None: the process-wide cache.
+        :param seed: (int) seed for this AI's random generator, to reproduce its moves. default=None: unseeded.
+        :param depth: (int) of moves to search ahead. default=1: rates only own moves with the position heuristic.
+        :param move_order: (MoveOrder) object for searches deeper than 1 move. default=None: all heuristics.
+        :param time_manager: (TimeManager) object of this player's game clock, that allocates search time to each
+        move (instead of timeout) and answers forced moves at once. default=None: no clock.
         """
         self.__game = game
         self.__player = player
         self.__last_found_move = None
+        self.__cache = cache if cache is not None else EvalCache.shared()
+        # Own random generator for breaking ties, so moves are reproducible from seed and thread safe.
+        self.__rng = random.Random(seed)
+        # Alpha-beta search for depth > 1, kept between moves so its tables help the next search.
+        self.__depth = depth
+        self.__search = Search(move_order) if depth > 1 else None
+        self.__time_manager = time_manager
 
     def find_legal_move(self, timeout=None):
         """
@@ -32,28 +51,19 @@ class AI:
         if not options_list:
             raise Exception('No possible AI moves.')
         # In case of very short timeout, assign random col index to last found move.
-        random_idx = AI._rand_idx(len(options_list))
+        random_idx = self._rand_idx(len(options_list))
         self.__last_found_move = options_list[random_idx][1]
+        # Playing with a clock - time manager answers forced moves and allocates time to search.
+        if self.__time_manager is not None:
+            return self._timed_move()
+        # Searching more than 1 move ahead - uses alpha-beta search on a compact copy of the board.
+        if self.__search is not None:
+            self.__last_found_move = self.__search.search(Board.from_game(self.__game), self.__depth, timeout)[0]
+            return self.__last_found_move
         # Assign an initial position rating dictionary.
         rating = {'pos': None, 'score': -1}
-        # Goes over each location in options_list.
-        for row, col in options_list:
-            # Assign position list for each direction (this position +- step of 3: to achieve combo of 4).
-            pos_list = {
-                'horizontal': self._create_pos_list(row, col - data.COMBO_STEP, 0, 1),
-                'vertical': self._create_pos_list(row - data.COMBO_STEP, col, 1, 0),
-                'diagonal_right': self._create_pos_list(row - data.COMBO_STEP, col - data.COMBO_STEP, 1, 1),
-                'diagonal_left': self._create_pos_list(row - data.COMBO_STEP, col + data.COMBO_STEP, 1, -1),
-            }
-            # Assign next move on row list for each relevant direction (same as pos_list, 1 row above)
-            next_move_list = {
-                'horizontal': self._create_pos_list(row - 1, col - data.COMBO_STEP, 0, 1),
-                'diagonal_right': self._create_pos_list((row - data.COMBO_STEP) - 1, col - data.COMBO_STEP, 1, 1),
-                'diagonal_left': self._create_pos_list((row - data.COMBO_STEP) - 1, col + data.COMBO_STEP, 1, -1),
-            }
-            # Analyse those position list for chances of winning, blocking or just progressing in the game.
-            # Subtracting from that the chances of giving the next player a chance to win next round.
-            pos_score = self._pos_list_analyser(pos_list.values()) + self._next_move_analyser(next_move_list.values())
+        # Goes over each location in options_list, with its score (cached if position was already evaluated).
+        for col, pos_score in self._rate_options(options_list):
             # If current score is better than previous highest score, assigns position and score to rating dictionary.
             if pos_score > rating['score']:
                 rating['pos'] = [col]
@@ -65,10 +75,88 @@ class AI:
                 rating['pos'].append(col)
         # Checks if rating[pos] contains a list of equally rated positions. If so, assign 1 randomly to last found move.
         if rating['pos'] is not None and len(rating['pos']) > 1:
-            self.__last_found_move = rating['pos'][AI._rand_idx(len(rating['pos']))]
+            self.__last_found_move = rating['pos'][self._rand_idx(len(rating['pos']))]
         # Returns the last found move, now that method is finished it stores the highest rated position (or random).
         return self.__last_found_move
 
+    def rate_moves(self):
+        """
+        Returns the heuristic score of each legal column in current position, for game analysis.
+        :return: (dict) of (int) column: (int) score. Empty if no legal moves.
+        """
+        options_list = self._vacant_spots_finder([], data.LAST_IDX_ROW, 0)
+        return dict(self._rate_options(options_list)) if options_list else {}
+
+    def _timed_move(self):
+        """
+        Private method for find_legal_move() when playing with a clock: Plays forced move at once, otherwise searches
+        (or rates moves, if depth is 1) within the time allocated by time manager, and charges the clock.
+        :return: (int) of column to go to.
+        """
+        start = time.perf_counter()
+        board = Board.from_game(self.__game)
+        forced = self.__time_manager.start_move(board)
+        if forced is not None:
+            self.__last_found_move = forced
+        elif self.__search is not None:
+            self.__last_found_move = self.__search.search(board, self.__depth,
+                                                          time_manager=self.__time_manager)[0]
+        else:
+            scores = self.rate_moves()
+            best_score = max(scores.values())
+            best_cols = [col for col, score in scores.items() if score == best_score]
+            self.__last_found_move = best_cols[self._rand_idx(len(best_cols))]
+        self.__time_manager.end_move(time.perf_counter() - start)
+        return self.__last_found_move
+
+    def get_search_stats(self):
+        """
+        Returns statistics of this AI's searches (nodes, nodes per second, cutoff rate, etc.), if depth > 1.
+        :return: (dict) of search statistics, or None if AI doesn't search.
+        """
+        if self.__search is not None:
+            return self.__search.get_stats()
+
+    def _rate_options(self, options_list):
+        """
+        Private method that rates all vacant positions, using evaluation cache for positions already evaluated.
+        :param options_list: (list) of (tuples) of (int) containing (row, col) of vacant spots.
+        :return: (list) of (tuples) of (int) containing (col, score) in same order as options_list.
+        """
+        key, mirrored = self.__game.get_position_key()
+        key = str(self.__player) + key
+        col_scores = self.__cache.get(key)
+        if col_scores is None:
+            col_scores = [None] * data.BOARD_COLS
+            # On a symmetric board, mirrored columns have the same score - rates only the left half and center.
+            symmetric = self.__game.is_symmetric()
+            for row, col in options_list:
+                if symmetric and col > data.LAST_IDX_COL // 2:
+                    col_scores[col] = col_scores[Game.mirror_col(col)]
+                else:
+                    col_scores[col] = self._rate_position(row, col)
+            # Stores scores in canonical orientation - reversed if the canonical key is of the mirrored board.
+            self.__cache.put(key, tuple(col_scores[::-1] if mirrored else col_scores))
+        elif mirrored:
+            col_scores = col_scores[::-1]
+        return [(col, col_scores[col]) for row, col in options_list]
+
+    def _rate_position(self, row, col):
+        """
+        Private method that rates a single vacant position by its chances of winning, blocking or progressing.
+        :param row: (int) of position row.
+        :param col: (int) of position col.
+        :return: (int) containing score for this position.
+        """
+        # Disc counts of each line through this position (all possible combinations with this position),
+        # and of each line through the position above it except vertical (next move on row), from evaluation state.
+        state = self.__game.get_eval_state()
+        pos_list = state.line_counts(row, col, self.__player)
+        next_move_list = state.line_counts(row - 1, col, self.__player, vertical=False) if row > 0 else []
+        # Analyse those lines for chances of winning, blocking or just progressing in the game.
+        # Subtracting from that the chances of giving the next player a chance to win next round.
+        return self._pos_list_analyser(pos_list) + self._next_move_analyser(next_move_list)
+
     def get_last_found_move(self):
         """
         This method returns the last found move using find_legal_move() method.
@@ -80,89 +168,57 @@ class AI:
     def _pos_list_analyser(self, pos_list):
         """
         Assign score to each position based on its chances for winning or blocking in this position.
-        :param pos_list: (list) of (lists) of players in all possible combinations in this position.
+        :param pos_list: (list) of (tuples) of (int) containing (this player discs, other player discs) of each
+        line through this position (all possible combinations in this position).
         :return: (int) containing score for this position.
         """
-        other_player = (self.__player % 2) + 1
         # Score bank to assign scores for each combination, according to how good it is.
         good_move_level = {1: 1, 2: 5, 3: 10, 4: 1000, 5: 5000}
         scores = 0
-        # Goes over each direction in position list.
-        for direction in pos_list:
-            for i in range(len(direction)):
-                # Check all combinations of 4 in direction.
-                if i + data.COMBO_STEP < len(direction):
-                    temp_combo = direction[i:i + data.COMBINATION_NUM]
-                    # If this player has 3 discs and 1 vacant (win), exits method with highest possible score.
-                    if temp_combo.count(self.__player) == 3:
-                        return good_move_level[5]
-                    # If other player has 3 discs and 1 vacant (block win), adds relevant score.
-                    if temp_combo.count(other_player) == 3:
-                        scores += good_move_level[4]
-                    # If this player has 2 discs and 2 vacant, adds relevant score.
-                    if temp_combo.count(self.__player) == 2 and temp_combo.count(data.INITIAL_VAL) == 2:
-                        scores += good_move_level[3]
-                    # If other player has 2 discs and 2 vacant, adds relevant score.
-                    if temp_combo.count(other_player) == 2 and temp_combo.count(data.INITIAL_VAL) == 2:
-                        scores += good_move_level[2]
-                    # If this player has 1 disc and 3 vacant, adds relevant score.
-                    if temp_combo.count(self.__player) == 1 and temp_combo.count(data.INITIAL_VAL) == 3:
-                        scores += good_move_level[1]
-                    # If other player has 1 disc and 3 vacant, adds relevant score.
-                    if temp_combo.count(other_player) == 1 and temp_combo.count(data.INITIAL_VAL) == 3:
-                        scores += good_move_level[1]
+        # Goes over each combination through position - the rest of the combination's positions are vacant.
+        for own, other in pos_list:
+            # If this player has 3 discs and 1 vacant (win), exits method with highest possible score.
+            if own == 3:
+                return good_move_level[5]
+            # If other player has 3 discs and 1 vacant (block win), adds relevant score.
+            if other == 3:
+                scores += good_move_level[4]
+            # If this player has 2 discs and 2 vacant, adds relevant score.
+            if own == 2 and other == 0:
+                scores += good_move_level[3]
+            # If other player has 2 discs and 2 vacant, adds relevant score.
+            if other == 2 and own == 0:
+                scores += good_move_level[2]
+            # If this player has 1 disc and 3 vacant, or other player has 1 disc and 3 vacant, adds relevant score.
+            if own + other == 1:
+                scores += good_move_level[1]
         # Returns scores result
         return scores
 
     def _next_move_analyser(self, next_move_list):
         """
         Assign negative score to each next move based on its chances for giving other player a chance to win next round.
-        :param next_move_list: (list) of (lists) of players in all possible combinations in next position.
+        :param next_move_list: (list) of (tuples) of (int) containing (this player discs, other player discs) of each
+        line through next position.
         :return: (int) containing score for this next position.
         """
-        other_player = (self.__player % 2) + 1
         # Score bank to assign scores for each combination, according to how bad it is.
         bad_move_level = {1: -10, 2: -100, 3: -500}
         scores = 0
-        # Goes over each direction in next move list.
-        for direction in next_move_list:
-            for i in range(len(direction)):
-                # Check all combinations of 4 in direction.
-                if i + data.COMBO_STEP < len(direction):
-                    temp_combo = direction[i:i + data.COMBINATION_NUM]
-                    # Other player has 3 discs and 1 vacant (avoid win in next turn), adds relevant score.
-                    if temp_combo.count(other_player) == 3:
-                        scores += bad_move_level[3]
-                    # This player has 3 discs and 1 vacant (avoid block in next turn), adds relevant score.
-                    if temp_combo.count(self.__player) == 3:
-                        scores += bad_move_level[2]
-                    # Other player has 2 discs and 2 vacant (avoid progression in next turn), adds relevant score.
-                    if temp_combo.count(other_player) == 2 and temp_combo.count(data.INITIAL_VAL) == 2:
-                        scores += bad_move_level[1]
+        # Goes over each combination through next position.
+        for own, other in next_move_list:
+            # Other player has 3 discs and 1 vacant (avoid win in next turn), adds relevant score.
+            if other == 3:
+                scores += bad_move_level[3]
+            # This player has 3 discs and 1 vacant (avoid block in next turn), adds relevant score.
+            if own == 3:
+                scores += bad_move_level[2]
+            # Other player has 2 discs and 2 vacant (avoid progression in next turn), adds relevant score.
+            if other == 2 and own == 0:
+                scores += bad_move_level[1]
         # Returns scores result
         return scores
 
-    def _create_pos_list(self, row, col, r_change, c_change):
-        """
-        Private method that creates positions list, of given position +- step of 3, to achieve combo of 4
-        :param row: (int) of given position row.
-        :param col: (int) of given position col.
-        :param r_change: (int) of (-1, 0, 1) to determine change in row indexes (-1: up, 0: stay put, 1: down).
-        :param c_change: (int) of (-1, 0, 1) to determine change in column indexes (-1: left, 0: stay put, 1: right).
-        :return: (list) of (tuples) of (int) containing relevant positions.
-        """
-        pos_list = []
-        # Creates list for max combo sequence (2 * step(3) + 1)
-        for pos in range(data.MAX_COMBO_SEQ):
-            this_idx = (row + pos * r_change, col + pos * c_change)
-            # Checks if this index is in range of game board list. If so, appends to pos_list the player at position.
-            if AI._pos_in_range(*this_idx, data.LAST_IDX_ROW, data.LAST_IDX_COL):
-                pos_list.append(self.__game.get_player_at(*this_idx))
-        # If the final pos_list is shorter the the combination num (4), deletes this list.
-        if len(pos_list) < data.COMBINATION_NUM:
-            return []
-        return pos_list
-
     def _vacant_spots_finder(self, vacant_spots, row, col):
         """
         Private recursive method for find_legal_move() method that finds all vacant positions in board (row/col).
@@ -188,25 +244,10 @@ class AI:
             else:
                 return self._vacant_spots_finder(vacant_spots, row - 1, col)
 
-    @staticmethod
-    def _rand_idx(list_length):
+    def _rand_idx(self, list_length):
         """
-        Private method that creates random index for a given list range.
+        Private method that creates random index for a given list range, using this AI's random generator.
         :param list_length: (int) of len(list) function.
         :return: (int) containing random index in list range.
         """
-        return random.randint(0, list_length - 1)
-
-    @staticmethod
-    def _pos_in_range(row, col, max_row, max_col):
-        """
-
-        :param row:
-        :param col:
-        :param max_row:
-        :param max_col:
-        :return: (boolean) True if given position in range, False if otherwise.
-        """
-        if 0 <= row <= max_row and 0 <= col <= max_col:
-            return True
-        return False
+        return self.__rng.randint(0, list_length - 1)
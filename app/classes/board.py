@@ -0,0 +1,187 @@
+from ..data import game_data as data
+
+
+class Board:
+    """
+    This classes creates a compact bitboard of the game, for fast searches: Each player's discs are stored as bits
+    of a single int, column by column from the bottom up, with one extra (always empty) bit on top of each column.
+    """
+
+    # Bits per column (board rows + 1 separator bit, so combinations can't wrap between columns).
+    COL_BITS = data.BOARD_ROWS + 1
+    # Bit shifts between neighbours in each direction - vertical, horizontal and both diagonals.
+    SHIFTS = (1, COL_BITS, COL_BITS - 1, COL_BITS + 1)
+
+    def __init__(self, first_player=1):
+        """
+        Init method for Board objects: Assigns empty player masks, column heights and moves stack.
+        :param first_player: (int) in range (1-2) of player to move first.
+        """
+        self.__masks = {1: 0, 2: 0}
+        self.__heights = [0] * data.BOARD_COLS
+        self.__moves = []
+        self.__current_player = first_player
+
+    @staticmethod
+    def from_game(game):
+        """
+        Creates Board object with the same position and current player of given Game object.
+        :param game: (Game) object to copy position from.
+        :return: (Board) object.
+        """
+        board = Board(game.get_current_player())
+        for col in range(data.BOARD_COLS):
+            # Goes over column from bottom row up, until first vacant position.
+            for row in range(data.LAST_IDX_ROW, -1, -1):
+                player = game.get_player_at(row, col)
+                if player == data.INITIAL_VAL:
+                    break
+                board.__masks[player] |= Board.bit(row, col)
+                board.__heights[col] += 1
+        # Moves count should match the discs on board (the moves order itself is unknown).
+        board.__moves = [None] * sum(board.__heights)
+        return board
+
+    def copy(self):
+        """
+        Creates a copy of this board, to play moves on without changing this board.
+        :return: (Board) object.
+        """
+        board = Board(self.__current_player)
+        board.__masks = dict(self.__masks)
+        board.__heights = list(self.__heights)
+        board.__moves = list(self.__moves)
+        return board
+
+    @staticmethod
+    def bit(row, col):
+        """
+        Returns the bit of given Game board position.
+        :param row: (int) of row (0 is top row, like in Game).
+        :param col: (int) of column.
+        :return: (int) with the single bit of this position.
+        """
+        return 1 << (col * Board.COL_BITS + data.LAST_IDX_ROW - row)
+
+    @staticmethod
+    def winning_lines():
+        """
+        Returns all lines on board where a combination can be made (e.g. 69 lines of 4 on standard board).
+        :return: (list) of (tuples) of (tuples) of (int) containing (row, col) positions of each line.
+        """
+        lines = []
+        for row in range(data.BOARD_ROWS):
+            for col in range(data.BOARD_COLS):
+                # Lines starting at this position - right, down, down-right and down-left.
+                for r_change, c_change in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    last_row = row + data.COMBO_STEP * r_change
+                    last_col = col + data.COMBO_STEP * c_change
+                    if 0 <= last_row <= data.LAST_IDX_ROW and 0 <= last_col <= data.LAST_IDX_COL:
+                        lines.append(tuple((row + step * r_change, col + step * c_change)
+                                           for step in range(data.COMBINATION_NUM)))
+        return lines
+
+    def can_play(self, col):
+        return self.__heights[col] < data.BOARD_ROWS
+
+    def legal_cols(self):
+        return [col for col in range(data.BOARD_COLS) if self.__heights[col] < data.BOARD_ROWS]
+
+    def play(self, col):
+        """
+        Moves current player to lowest vacant row in given column, and switches current player.
+        Column must be legal (see can_play()), this method doesn't check it for speed.
+        :param col: (int) of column to move to.
+        """
+        self.__masks[self.__current_player] |= 1 << (col * Board.COL_BITS + self.__heights[col])
+        self.__heights[col] += 1
+        self.__moves.append(col)
+        self.__current_player = 3 - self.__current_player
+
+    def undo(self):
+        """
+        Takes back the last move played with play() method.
+        :return: (int) of column of the move taken back.
+        """
+        col = self.__moves.pop()
+        self.__current_player = 3 - self.__current_player
+        self.__heights[col] -= 1
+        self.__masks[self.__current_player] &= ~(1 << (col * Board.COL_BITS + self.__heights[col]))
+        return col
+
+    def last_move_won(self):
+        """
+        Checks if the player that made the last move has a combination.
+        :return: (boolean) True if last player won, False if otherwise.
+        """
+        return Board.has_combination(self.__masks[3 - self.__current_player])
+
+    def is_winning_move(self, col, player=None):
+        """
+        Checks if moving given player to given column makes a combination.
+        :param col: (int) of legal column.
+        :param player: (int) in range (1-2) of player to check. default=None: current player.
+        :return: (boolean) True if move wins, False if otherwise.
+        """
+        player = player if player is not None else self.__current_player
+        mask = self.__masks[player] | 1 << (col * Board.COL_BITS + self.__heights[col])
+        return Board.has_combination(mask)
+
+    @staticmethod
+    def has_combination(mask):
+        """
+        Checks if given player mask has COMBINATION_NUM discs in a row in any direction.
+        :param mask: (int) of player discs bits.
+        :return: (boolean) True if any combination was found, False if not.
+        """
+        for shift in Board.SHIFTS:
+            combo = mask
+            for step in range(1, data.COMBINATION_NUM):
+                combo &= mask >> (shift * step)
+            if combo:
+                return True
+        return False
+
+    def is_full(self):
+        return len(self.__moves) == data.BOARD_ROWS * data.BOARD_COLS
+
+    def is_symmetric(self):
+        """
+        Checks if this position is the same as its mirror image.
+        :return: (boolean) True if position is symmetric, False if otherwise.
+        """
+        return self.__masks[1] == Board.mirror_mask(self.__masks[1]) and \
+            self.__masks[2] == Board.mirror_mask(self.__masks[2])
+
+    @staticmethod
+    def mirror_mask(mask):
+        """
+        Returns given player mask mirrored left to right.
+        :param mask: (int) of player discs bits.
+        :return: (int) of mirrored mask.
+        """
+        col_mask = (1 << Board.COL_BITS) - 1
+        mirrored = 0
+        for col in range(data.BOARD_COLS):
+            col_bits = (mask >> (col * Board.COL_BITS)) & col_mask
+            mirrored |= col_bits << ((data.LAST_IDX_COL - col) * Board.COL_BITS)
+        return mirrored
+
+    def get_key(self):
+        """
+        Returns key of this position (unique position and player to move), e.g. for transposition tables.
+        :return: (tuple) of (int) containing current player mask and mask of all discs.
+        """
+        return self.__masks[self.__current_player], self.__masks[1] | self.__masks[2]
+
+    def get_mask(self, player):
+        return self.__masks[player]
+
+    def get_height(self, col):
+        return self.__heights[col]
+
+    def get_current_player(self):
+        return self.__current_player
+
+    def get_moves_count(self):
+        return len(self.__moves)
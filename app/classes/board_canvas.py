@@ -0,0 +1,158 @@
+from ..data import game_data as data
+from .static.style import Style
+import tkinter as tk
+import time
+
+
+class BoardCanvas:
+    """
+    This classes draws the game board on a single Tkinter Canvas: Each cell is a canvas image item that is
+    reconfigured in place when its value changes (images are loaded once), and new discs fall into place with an
+    animation driven by a frame scheduler with a fixed frame budget.
+    """
+
+    def __init__(self, frame, board):
+        """
+        Init method for BoardCanvas objects: Loads cell images, creates canvas and its cell items.
+        :param frame: Tkinter (Frame) object to create canvas in.
+        :param board: (list) of (lists) of Game board, to draw initially.
+        """
+        # Loads each cell image once - all cell items share these images.
+        self.__images = {val: tk.PhotoImage(file=path) for val, path in Style.IMAGES['CELL'].items()}
+        self.__cell_size = self.__images[data.INITIAL_VAL].width()
+        self.__canvas = tk.Canvas(frame, width=data.BOARD_COLS * self.__cell_size,
+                                  height=data.BOARD_ROWS * self.__cell_size, bg=Style.COLOR['BOARD'],
+                                  highlightthickness=0)
+        # Values currently drawn in each cell, and the canvas item of each cell.
+        self.__drawn = [[data.INITIAL_VAL] * data.BOARD_COLS for _ in range(data.BOARD_ROWS)]
+        self.__cells = [[self.__canvas.create_image(col * self.__cell_size, row * self.__cell_size, anchor='nw',
+                                                    image=self.__images[data.INITIAL_VAL])
+                         for col in range(data.BOARD_COLS)] for row in range(data.BOARD_ROWS)]
+        # Falling disc item (hidden when no disc is falling) and the state of current drop animation.
+        self.__falling = self.__canvas.create_image(0, 0, anchor='nw', image=self.__images[data.INITIAL_VAL],
+                                                    state='hidden')
+        self.__drop = None
+        self.__next_frame = None
+        # Optional function called on each animation frame, and frame time statistics.
+        self.__frame_hook = None
+        self.__frame_stats = {'frames': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'over_budget': 0}
+        self.__last_frame = None
+        self.redraw(board)
+        # Stops drop animation when canvas is destroyed (e.g. game screen closed while a disc falls).
+        self.__canvas.bind('<Destroy>', lambda event: self._stop())
+
+    def get_canvas(self):
+        return self.__canvas
+
+    def is_dropping(self):
+        return self.__drop is not None
+
+    def set_frame_hook(self, frame_hook):
+        """
+        Sets function to call on each animation frame, e.g. to verify the animation holds 60 fps.
+        :param frame_hook: (function) that gets (float) of ms since previous frame and (float) of ms spent drawing
+        this frame. None to remove hook.
+        """
+        self.__frame_hook = frame_hook
+
+    def get_frame_stats(self):
+        """
+        Returns animation frame statistics.
+        :return: (dict) containing frames, average and max ms between frames and number of frames over budget.
+        """
+        stats = dict(self.__frame_stats)
+        stats['avg_ms'] = stats['total_ms'] / stats['frames'] if stats['frames'] else 0
+        return stats
+
+    def redraw(self, board):
+        """
+        Reconfigures the image of each cell whose value changed since it was drawn.
+        :param board: (list) of (lists) of Game board.
+        """
+        for row in range(data.BOARD_ROWS):
+            for col in range(data.BOARD_COLS):
+                if board[row][col] != self.__drawn[row][col]:
+                    self.__canvas.itemconfigure(self.__cells[row][col], image=self.__images[board[row][col]])
+                    self.__drawn[row][col] = board[row][col]
+
+    def drop(self, board, row, col, player, on_done=None):
+        """
+        Animates a disc falling into given position, then redraws the board. If a disc is still falling,
+        it lands immediately first.
+        :param board: (list) of (lists) of Game board, after the move.
+        :param row: (int) of row the disc lands in.
+        :param col: (int) of column of the disc.
+        :param player: (int) in range (1-2) of player of the disc.
+        :param on_done: (function) to call when disc landed. default=None.
+        """
+        if self.__drop is not None:
+            self._land()
+        # The target cell stays drawn empty until the disc lands on it and board is redrawn.
+        self.__canvas.itemconfigure(self.__falling, image=self.__images[player], state='normal')
+        self.__canvas.coords(self.__falling, col * self.__cell_size, -self.__cell_size)
+        self.__canvas.tag_raise(self.__falling)
+        # Falls from above the board - time grows with square root of distance, like a falling object.
+        duration = data.DROP_TIME * ((row + 1) / data.BOARD_ROWS) ** 0.5 / 1000
+        self.__drop = {'board': board, 'row': row, 'col': col, 'start': time.perf_counter(), 'duration': duration,
+                       'on_done': on_done}
+        self.__last_frame = None
+        self._frame()
+
+    def _frame(self):
+        """
+        Private method of the frame scheduler: Moves the falling disc by the time passed since drop started (so slow
+        frames don't slow the animation), then schedules next frame after what's left of the frame budget.
+        """
+        self.__next_frame = None
+        if self.__drop is None:
+            return
+        frame_start = time.perf_counter()
+        progress = min(1.0, (frame_start - self.__drop['start']) / self.__drop['duration'])
+        if progress >= 1.0:
+            self._land()
+        else:
+            # Accelerating fall - distance grows with square of time.
+            top = -self.__cell_size
+            y = top + (self.__drop['row'] * self.__cell_size - top) * progress * progress
+            self.__canvas.coords(self.__falling, self.__drop['col'] * self.__cell_size, y)
+        work_ms = (time.perf_counter() - frame_start) * 1000
+        self._record_frame(frame_start, work_ms)
+        if self.__drop is not None:
+            self.__next_frame = self.__canvas.after(max(1, int(data.FRAME_TIME - work_ms)), self._frame)
+
+    def _land(self):
+        """
+        Private method that ends drop animation: Hides falling disc, redraws board and calls drop's on_done function.
+        """
+        drop = self.__drop
+        self._stop()
+        self.__canvas.itemconfigure(self.__falling, state='hidden')
+        self.redraw(drop['board'])
+        if drop['on_done'] is not None:
+            drop['on_done']()
+
+    def _stop(self):
+        """
+        Private method that cancels drop animation without landing the disc (its on_done function isn't called).
+        """
+        self.__drop = None
+        if self.__next_frame is not None:
+            self.__canvas.after_cancel(self.__next_frame)
+            self.__next_frame = None
+
+    def _record_frame(self, frame_start, work_ms):
+        """
+        Private method that records frame time statistics and calls frame hook, if set.
+        :param frame_start: (float) of perf_counter() time this frame started.
+        :param work_ms: (float) of ms spent drawing this frame.
+        """
+        if self.__last_frame is not None:
+            frame_ms = (frame_start - self.__last_frame) * 1000
+            self.__frame_stats['frames'] += 1
+            self.__frame_stats['total_ms'] += frame_ms
+            self.__frame_stats['max_ms'] = max(self.__frame_stats['max_ms'], frame_ms)
+            if frame_ms > data.FRAME_TIME * 1.5:
+                self.__frame_stats['over_budget'] += 1
+            if self.__frame_hook is not None:
+                self.__frame_hook(frame_ms, work_ms)
+        self.__last_frame = frame_start
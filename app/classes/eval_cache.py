@@ -0,0 +1,143 @@
+from ..data import game_data as data
+from collections import OrderedDict
+import atexit
+import json
+import os
+import threading
+
+
+class EvalCache:
+    """
+    This classes creates a process-wide LRU cache of AI position evaluations, keyed by canonical position
+    (see Game.get_position_key()): A position and its mirror image share the same entry.
+    """
+
+    # The shared cache instance, created on first use by shared() method.
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, max_size=data.EVAL_CACHE_SIZE, path=data.EVAL_CACHE_FILE, track_new=False):
+        """
+        Init method for EvalCache objects: Assigns size limit, entries dictionary, statistics and disk file.
+        If disk file is specified and exists, reloads its entries and saves them back on program exit.
+        :param max_size: (int) of max number of cached positions, least recently used are evicted first.
+        :param path: (str) containing path to disk file to persist cache to. default=None: memory only.
+        :param track_new: (boolean) True to keep entries put since last take_new() call, e.g. so worker processes
+        can send them to a cache that merges them. default=False.
+        """
+        if max_size < 1:
+            raise Exception('Cache size must be positive.')
+        self.__max_size = max_size
+        self.__path = path
+        self.__entries = OrderedDict()
+        self.__stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        # Entries put since last take_new() call, if tracked.
+        self.__new = {} if track_new else None
+        # Lock for entries and statistics - the cache may be used by several threads at once.
+        self.__lock = threading.Lock()
+        if self.__path is not None:
+            self.load()
+            atexit.register(self.save)
+
+    @staticmethod
+    def shared():
+        """
+        Returns the process-wide cache instance, creating it with default game data settings if needed.
+        :return: (EvalCache) object shared by all AI objects.
+        """
+        with EvalCache.__shared_lock:
+            if EvalCache.__shared is None:
+                EvalCache.__shared = EvalCache()
+            return EvalCache.__shared
+
+    def get(self, key):
+        """
+        Returns cached value of given key and marks it as recently used.
+        :param key: (str) of canonical position key.
+        :return: cached value, or None if key is not cached.
+        """
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is None:
+                self.__stats['misses'] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__stats['hits'] += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Caches value for given key, evicting least recently used entries if size limit was reached.
+        :param key: (str) of canonical position key.
+        :param value: value to cache (not None).
+        """
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            if self.__new is not None:
+                self.__new[key] = value
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__stats['evictions'] += 1
+
+    def take_new(self):
+        """
+        Returns entries put since last call (only if cache was created with track_new=True), and forgets them.
+        :return: (list) of (tuples) of key and value, in order they were put.
+        """
+        with self.__lock:
+            if self.__new is None:
+                return []
+            items = list(self.__new.items())
+            self.__new = {}
+            return items
+
+    def get_stats(self):
+        """
+        Returns cache statistics.
+        :return: (dict) containing hits, misses, evictions, current size and max size.
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['size'] = len(self.__entries)
+            stats['max_size'] = self.__max_size
+            return stats
+
+    def clear(self):
+        """
+        Removes all cached entries and resets statistics.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def save(self):
+        """
+        Saves cached entries to disk file (JSON list of key and scores pairs), if one was specified. Writes to
+        temp file first, so a crash while saving does not corrupt previous file.
+        """
+        if self.__path is None:
+            return
+        with self.__lock:
+            items = [[key, list(value)] for key, value in self.__entries.items()]
+        temp_path = self.__path + '.tmp'
+        with open(temp_path, 'w') as cache_file:
+            json.dump(items, cache_file)
+        os.replace(temp_path, self.__path)
+
+    def load(self, path=None):
+        """
+        Loads cached entries from disk file, if one was specified and exists. Keeps only the most recently
+        used entries that fit in the size limit. The file is plain JSON data (not pickle), so loading a
+        tampered file can't run code.
+        :param path: (str) containing path to disk file to load from. default=None: this cache's own file.
+        """
+        path = path if path is not None else self.__path
+        if path is None or not os.path.exists(path):
+            return
+        with open(path) as cache_file:
+            items = json.load(cache_file)
+        with self.__lock:
+            for key, value in items[-self.__max_size:]:
+                # Scores are saved as JSON lists - cached as tuples, as AI puts them.
+                self.__entries[key] = tuple(value)
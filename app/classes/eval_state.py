@@ -0,0 +1,117 @@
+from ..data import game_data as data
+from .board import Board
+
+
+def _lines_by_position(lines):
+    """
+    Private function that maps each board position to the lines through it.
+    :param lines: (list) of lines, each a (tuple) of (row, col) positions.
+    :return: (list) of (lists) of (lists) of (int) containing line indexes through each [row][col].
+    """
+    cell_lines = [[[] for _ in range(data.BOARD_COLS)] for _ in range(data.BOARD_ROWS)]
+    for idx, line in enumerate(lines):
+        for row, col in line:
+            cell_lines[row][col].append(idx)
+    return cell_lines
+
+
+class EvalState:
+    """
+    This classes keeps, for every winning line on board, the number of discs of each player in it. Each move updates
+    only the lines through its position, so threat counts and the position score are read without scanning the board.
+    """
+
+    # The winning lines (shared by all objects), the indexes of lines through each board position,
+    # and which lines are vertical.
+    LINES = Board.winning_lines()
+    CELL_LINES = _lines_by_position(LINES)
+    VERTICAL = [line[0][1] == line[-1][1] for line in LINES]
+
+    def __init__(self):
+        """
+        Init method for EvalState objects: Assigns empty line counts, threats and scores.
+        """
+        self.__counts = {1: [0] * len(EvalState.LINES), 2: [0] * len(EvalState.LINES)}
+        # Lines with COMBO_STEP discs of player and none of the other player (one move from win).
+        self.__threats = {1: 0, 2: 0}
+        # Sum of SEARCH_LINE_WEIGHTS of lines with discs of player and none of the other player.
+        self.__open_score = {1: 0, 2: 0}
+
+    def copy(self):
+        """
+        Creates a copy of this evaluation state.
+        :return: (EvalState) object.
+        """
+        state = EvalState()
+        state.__counts = {1: list(self.__counts[1]), 2: list(self.__counts[2])}
+        state.__threats = dict(self.__threats)
+        state.__open_score = dict(self.__open_score)
+        return state
+
+    def add(self, row, col, player):
+        """
+        Updates the lines through given position for a disc of given player placed in it.
+        :param row: (int) of row of the disc.
+        :param col: (int) of column of the disc.
+        :param player: (int) in range (1-2) of player of the disc.
+        """
+        self._update(row, col, player, 1)
+
+    def remove(self, row, col, player):
+        """
+        Updates the lines through given position for a disc of given player taken from it (undo of add()).
+        :param row: (int) of row of the disc.
+        :param col: (int) of column of the disc.
+        :param player: (int) in range (1-2) of player of the disc.
+        """
+        self._update(row, col, player, -1)
+
+    def get_threats(self, player):
+        return self.__threats[player]
+
+    def get_score(self, player):
+        """
+        Returns position score for given player: its open lines score minus the other player's open lines score.
+        :param player: (int) in range (1-2) of player.
+        :return: (int) of position score.
+        """
+        return self.__open_score[player] - self.__open_score[3 - player]
+
+    def line_counts(self, row, col, player, vertical=True):
+        """
+        Returns disc counts of each line through given position.
+        :param row: (int) of row of position.
+        :param col: (int) of column of position.
+        :param player: (int) in range (1-2) of player to count as own discs.
+        :param vertical: (boolean) False to skip the vertical line. default=True.
+        :return: (list) of (tuples) of (int) containing (own discs, other player discs) of each line.
+        """
+        own, other = self.__counts[player], self.__counts[3 - player]
+        return [(own[idx], other[idx]) for idx in EvalState.CELL_LINES[row][col]
+                if vertical or not EvalState.VERTICAL[idx]]
+
+    def _update(self, row, col, player, change):
+        """
+        Private method for add() and remove(). Changes player's count in each line through position, replacing the
+        line's old part in threats and open scores with its new part.
+        :param row: (int) of row of the disc.
+        :param col: (int) of column of the disc.
+        :param player: (int) in range (1-2) of player of the disc.
+        :param change: (int) 1 to add disc, -1 to remove it.
+        """
+        other_player = 3 - player
+        own, other = self.__counts[player], self.__counts[other_player]
+        weights = data.SEARCH_LINE_WEIGHTS
+        for idx in EvalState.CELL_LINES[row][col]:
+            own_count, other_count = own[idx], other[idx]
+            new_count = own_count + change
+            own[idx] = new_count
+            # A line scores only for a player who is alone in it.
+            if other_count == 0:
+                self.__open_score[player] += weights[new_count] - weights[own_count]
+                self.__threats[player] += (new_count == data.COMBO_STEP) - (own_count == data.COMBO_STEP)
+            elif own_count == 0 or new_count == 0:
+                # Line changes between open and blocked for the other player.
+                sign = 1 if new_count == 0 else -1
+                self.__open_score[other_player] += sign * weights[other_count]
+                self.__threats[other_player] += sign * (other_count == data.COMBO_STEP)
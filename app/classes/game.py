@@ -1,4 +1,5 @@
 from ..data import game_data as data
+from .eval_state import EvalState
 import random
 
 
@@ -7,15 +8,26 @@ class Game:
     This classes creates the Game board and the logic of turns, moving players, winning or declare a tie.
     """
 
-    def __init__(self):
+    def __init__(self, first_player=None, seed=None):
         """
-        Init method for Game objects: Assigns board list, turn counter, first player and last move.
+        Init method for Game objects: Assigns random generator, board list, turn counter, first player, last move,
+        moves stack and evaluation state.
+        :param first_player: (int) in range (1-2) of player to start the game. default=None: random player.
+        :param seed: (int) seed for this game's random generator, to reproduce a game. default=None: unseeded.
         """
+        # Own random generator, so games are reproducible from seed and don't share state across threads.
+        self.__rng = random.Random(seed)
         self.__board = Game._create_board_list(data.BOARD_ROWS, data.BOARD_COLS)
         self.__turn_counter = 1
-        # Randomly choosing first player
-        self.__first_player = random.randint(1, 2)
+        # Randomly choosing first player, unless specified.
+        self.__first_player = first_player if first_player is not None else self.__rng.randint(1, 2)
         self.__last_move = None
+        # Moves made, as (row, col, turn) - for undo_move() and move history.
+        self.__moves = []
+        # Discs marked with WIN_VAL when a combination was found, to restore on undo.
+        self.__win_combo = []
+        # Disc counts of each winning line, updated on each move (and undo).
+        self.__eval_state = EvalState()
 
     def make_move(self, column):
         """
@@ -35,6 +47,26 @@ class Game:
         else:
             self.__board[vacant_row][column] = self.get_current_player()
             self.__last_move = (vacant_row, column)
+            self.__moves.append((vacant_row, column, self.__turn_counter))
+            self.__eval_state.add(vacant_row, column, self.get_current_player())
+
+    def undo_move(self):
+        """
+        This method takes back the last move made with make_move(), and the turn added after it (if added).
+        :return: raise exception if no moves were made.
+        """
+        if not self.__moves:
+            raise Exception('No moves to undo.')
+        row, col, turn = self.__moves.pop()
+        self.__turn_counter = turn
+        player = self.get_current_player()
+        # If the move made a combination, restores the discs marked as winning to the player.
+        for win_row, win_col in self.__win_combo:
+            self.__board[win_row][win_col] = player
+        self.__win_combo = []
+        self.__board[row][col] = data.INITIAL_VAL
+        self.__last_move = self.__moves[-1][:2] if self.__moves else None
+        self.__eval_state.remove(row, col, player)
 
     def get_winner(self):
         """
@@ -81,6 +113,74 @@ class Game:
     def get_board(self):
         return self.__board
 
+    def get_last_move(self):
+        return self.__last_move
+
+    def get_move_history(self):
+        return [col for row, col, turn in self.__moves]
+
+    def get_first_player(self):
+        return self.__first_player
+
+    def get_eval_state(self):
+        return self.__eval_state
+
+    def copy(self):
+        """
+        Creates a copy of this game, to try moves on without changing this game (e.g. in another thread).
+        :return: (Game) object with same board, turn and players.
+        """
+        game = Game(self.__first_player)
+        game.__board = [list(row) for row in self.__board]
+        game.__turn_counter = self.__turn_counter
+        game.__last_move = self.__last_move
+        game.__moves = list(self.__moves)
+        game.__win_combo = list(self.__win_combo)
+        game.__eval_state = self.__eval_state.copy()
+        return game
+
+    def get_position_key(self):
+        """
+        Returns canonical key of this board position: the board is left-right symmetric, so a position and its
+        mirror image share the same key (the smaller of the two).
+        :return: (tuple) of (str) containing canonical key and (boolean) True if key is of the mirrored board.
+        """
+        rows = [''.join('0' if val == data.INITIAL_VAL else str(val) for val in row) for row in self.__board]
+        key = ''.join(rows)
+        mirror_key = ''.join(row[::-1] for row in rows)
+        if mirror_key < key:
+            return mirror_key, True
+        return key, False
+
+    def is_symmetric(self):
+        """
+        Checks if this board position is the same as its mirror image (e.g. empty board).
+        :return: (boolean) True if board is symmetric, False if otherwise.
+        """
+        return all(row == row[::-1] for row in self.__board)
+
+    @staticmethod
+    def mirror_col(col):
+        """
+        Returns the column matching given column in the mirror image of the board.
+        :param col: (int) of column to mirror.
+        :return: (int) of mirrored column.
+        """
+        return data.LAST_IDX_COL - col
+
+    @staticmethod
+    def canonical_moves(moves):
+        """
+        Returns canonical version of a game's move sequence - the smaller of the sequence and its mirror image,
+        so mirrored games are stored once (e.g. in game archives or opening books).
+        :param moves: (list) of (int) containing columns played, in order.
+        :return: (tuple) of (list) of (int) containing canonical moves and (boolean) True if moves were mirrored.
+        """
+        mirror_moves = [Game.mirror_col(col) for col in moves]
+        if mirror_moves < list(moves):
+            return mirror_moves, True
+        return list(moves), False
+
     def _combination_checker(self, row, col):
         """
         Private method for get_winner(). Checks if any combinations were made - horizontal, vertical or diagonal.
@@ -128,6 +228,7 @@ class Game:
     def _check_win(self, combo_list):
         for row, col in combo_list:
             self.__board[row][col] = data.WIN_VAL
+        self.__win_combo = list(combo_list)
         return True
 
     def _vacancy_checker(self, row, col):
@@ -0,0 +1,230 @@
+from ..data import game_data as data
+from .eval_cache import EvalCache
+from .game import Game
+from .ai import AI
+from multiprocessing import Pool
+import json
+import os
+
+# Position cache of this process (each worker process has its own, loaded from the shared cache file). Its new
+# entries are sent with each game report, and merged into the shared cache file after each chunk.
+_worker_cache = None
+
+
+class GameAnalysis:
+    """
+    This classes analyses archived games in a stream: Reads game records (JSON lines) from archive file, replays each
+    game through Game and rates every position with AI heuristic, to find each player's accuracy (moves rated as
+    good as the best move) and blunders. Games are split between worker processes, reports are appended to a report
+    file (JSON lines) after each chunk of games, and a checkpoint file allows resuming an interrupted run. Positions
+    rated by the workers are merged into a shared position cache file after each chunk, so later runs (and workers
+    started by them) reuse them.
+    """
+
+    def __init__(self, archive_path, report_path, checkpoint_path=None, workers=1, cache_path=None,
+                 chunk_size=data.ANALYSIS_CHUNK_SIZE):
+        """
+        Init method for GameAnalysis objects: Assigns files and worker settings.
+        :param archive_path: (str) containing path of archive file - a JSON game record per line (see record()).
+        :param report_path: (str) containing path of report file - a JSON game report per line is appended.
+        :param checkpoint_path: (str) containing path of checkpoint file. default=None: report path + '.checkpoint'.
+        :param workers: (int) of worker processes. default=1: analyse in this process.
+        :param cache_path: (str) containing path of position cache file (see EvalCache) to start each worker's cache
+        from, and merge workers' new positions into. default=None: EVAL_CACHE_FILE, or report path + '.cache' if
+        it is None.
+        :param chunk_size: (int) of number of games analysed between checkpoints.
+        """
+        self.__archive_path = archive_path
+        self.__report_path = report_path
+        self.__checkpoint_path = checkpoint_path if checkpoint_path is not None else report_path + '.checkpoint'
+        self.__workers = workers
+        if cache_path is None:
+            cache_path = data.EVAL_CACHE_FILE if data.EVAL_CACHE_FILE is not None else report_path + '.cache'
+        self.__cache_path = cache_path
+        self.__chunk_size = chunk_size
+
+    @staticmethod
+    def record(game, players, game_id=None):
+        """
+        Creates archive record (a JSON line) of given game, with canonical moves - mirrored games are stored once,
+        and get the same analysis (the AI heuristic is mirror symmetric).
+        :param game: (Game) object of played game.
+        :param players: (dict) of (int) player: (str) player type, e.g. {1: 'human', 2: 'AI'}.
+        :param game_id: id of game to show in its report. default=None.
+        :return: (str) of JSON record, without line break.
+        """
+        moves = Game.canonical_moves(game.get_move_history())[0]
+        return json.dumps({'id': game_id, 'first_player': game.get_first_player(), 'moves': moves,
+                           'players': {str(player): player_type for player, player_type in players.items()}})
+
+    def run(self, max_games=None):
+        """
+        Analyses archive games from the checkpoint (or start of archive) to the end of archive, or until given number
+        of games was analysed in this run.
+        :param max_games: (int) of max games to analyse in this run. default=None: all remaining games.
+        :return: (dict) containing totals of all analysed games (also from previous runs) - games, errors and per
+        player type moves, best moves, blunders, total score loss and accuracy.
+        """
+        checkpoint = self._load_checkpoint()
+        # Shared position cache, saved before each checkpoint.
+        cache = EvalCache(data.EVAL_CACHE_SIZE, self.__cache_path)
+        pool = Pool(self.__workers, _init_worker, (self.__cache_path,)) if self.__workers > 1 else None
+        if pool is None:
+            _init_worker(self.__cache_path)
+        try:
+            with open(self.__archive_path, 'rb') as archive:
+                archive.seek(checkpoint['offset'])
+                analysed = 0
+                while max_games is None or analysed < max_games:
+                    size = self.__chunk_size if max_games is None else min(self.__chunk_size, max_games - analysed)
+                    lines = self._read_chunk(archive, size)
+                    if not lines:
+                        break
+                    results = pool.map(_analyse_game, lines) if pool is not None else list(map(_analyse_game, lines))
+                    for _, entries in results:
+                        for key, value in entries:
+                            cache.put(key, value)
+                    self._write_reports([report for report, _ in results], checkpoint)
+                    cache.save()
+                    checkpoint['offset'] = archive.tell()
+                    self._save_checkpoint(checkpoint)
+                    analysed += len(lines)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return GameAnalysis._summary(checkpoint['totals'])
+
+    def _load_checkpoint(self):
+        """
+        Private method that loads checkpoint, if exists. The report file is cut back to its size at the checkpoint,
+        dropping reports written after it (their games are analysed again).
+        :return: (dict) containing archive offset, report file size and totals.
+        """
+        if os.path.exists(self.__checkpoint_path) and os.path.exists(self.__report_path):
+            with open(self.__checkpoint_path) as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+            with open(self.__report_path, 'r+b') as report_file:
+                report_file.truncate(checkpoint['report_size'])
+            return checkpoint
+        # No checkpoint (or its report file was removed) - new run, with new report file.
+        open(self.__report_path, 'w').close()
+        return {'offset': 0, 'report_size': 0, 'totals': {'games': 0, 'errors': 0, 'players': {}}}
+
+    def _save_checkpoint(self, checkpoint):
+        """
+        Private method that saves checkpoint. Writes to temp file first, so a crash while saving does not corrupt
+        previous checkpoint.
+        :param checkpoint: (dict) containing archive offset, report file size and totals.
+        """
+        temp_path = self.__checkpoint_path + '.tmp'
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(temp_path, self.__checkpoint_path)
+
+    @staticmethod
+    def _read_chunk(archive, size):
+        """
+        Private method that reads up to given number of game records from archive, skipping blank lines.
+        :param archive: (file) of archive, opened in binary mode.
+        :param size: (int) of max number of records.
+        :return: (list) of (str) of records.
+        """
+        lines = []
+        while len(lines) < size:
+            line = archive.readline()
+            if not line:
+                break
+            if line.strip():
+                lines.append(line.decode('utf-8'))
+        return lines
+
+    def _write_reports(self, reports, checkpoint):
+        """
+        Private method that appends reports to report file and adds them to checkpoint totals.
+        :param reports: (list) of (dict) of game reports.
+        :param checkpoint: (dict) containing report file size and totals, updated.
+        """
+        totals = checkpoint['totals']
+        with open(self.__report_path, 'a') as report_file:
+            for report in reports:
+                report_file.write(json.dumps(report) + '\n')
+                totals['games'] += 1
+                if 'error' in report:
+                    totals['errors'] += 1
+                    continue
+                for player_report in report['players'].values():
+                    player_totals = totals['players'].setdefault(player_report['type'], {
+                        'moves': 0, 'best_moves': 0, 'blunders': 0, 'loss': 0})
+                    for key in player_totals:
+                        player_totals[key] += player_report[key]
+            report_file.flush()
+            os.fsync(report_file.fileno())
+            checkpoint['report_size'] = report_file.tell()
+
+    @staticmethod
+    def _summary(totals):
+        """
+        Private method that adds accuracy and average loss per move of each player type to totals.
+        :param totals: (dict) of checkpoint totals.
+        :return: (dict) of totals with accuracy.
+        """
+        summary = json.loads(json.dumps(totals))
+        for player_totals in summary['players'].values():
+            moves = player_totals['moves']
+            player_totals['accuracy'] = player_totals['best_moves'] / moves if moves else 0
+            player_totals['avg_loss'] = player_totals['loss'] / moves if moves else 0
+        return summary
+
+
+def _init_worker(cache_path):
+    """
+    Private function that creates the position cache of this process, starting from the shared cache file (if exists).
+    :param cache_path: (str) containing path of cache file, or None.
+    """
+    global _worker_cache
+    _worker_cache = EvalCache(data.EVAL_CACHE_SIZE, None, track_new=True)
+    _worker_cache.load(cache_path)
+
+
+def _analyse_game(line):
+    """
+    Private function for worker processes - replays a game record and rates each of its moves.
+    :param line: (str) of JSON game record.
+    :return: (tuple) of (dict) of game report and (list) of position cache entries added while rating the game.
+    Game report: id, winner (0 for tie, None if unfinished), number of moves, per player type, moves, best moves,
+    blunders and total score loss, and list of blunders (ply, player, col, best col, loss). Report contains only id
+    and error if record is not a legal game.
+    """
+    game_id = None
+    try:
+        record = json.loads(line)
+        game_id = record.get('id')
+        game = Game(record['first_player'])
+        players = {player: {'type': record['players'].get(str(player), 'unknown'), 'moves': 0, 'best_moves': 0,
+                            'blunders': 0, 'loss': 0} for player in (1, 2)}
+        blunders = []
+        winner = None
+        for ply, col in enumerate(record['moves']):
+            if winner is not None:
+                raise Exception('Moves after end of game.')
+            player = game.get_current_player()
+            # Rates all legal columns, and compares the played column with the best one.
+            scores = AI(game, player, _worker_cache).rate_moves()
+            if col not in scores:
+                raise Exception('Illegal move.')
+            best_col = max(scores, key=scores.get)
+            loss = scores[best_col] - scores[col]
+            players[player]['moves'] += 1
+            players[player]['best_moves'] += loss == 0
+            players[player]['loss'] += loss
+            if loss >= data.ANALYSIS_BLUNDER_LOSS:
+                players[player]['blunders'] += 1
+                blunders.append({'ply': ply, 'player': player, 'col': col, 'best_col': best_col, 'loss': loss})
+            game.make_move(col)
+            winner = game.get_winner()
+            game.add_turn()
+    except Exception as error:
+        return {'id': game_id, 'error': str(error)}, _worker_cache.take_new()
+    return {'id': game_id, 'winner': winner, 'moves': len(record['moves']), 'players': {
+        str(player): report for player, report in players.items()}, 'blunders': blunders}, _worker_cache.take_new()
@@ -0,0 +1,184 @@
+from ..data import game_data as data
+from .game import Game
+from .ai import AI
+import numpy as np
+
+
+class GameBatch:
+    """
+    This classes steps a batch of K games at once with NumPy arrays, for vectorized self-play and simulations:
+    Legal move masks, moves, win detection and reset of finished games are computed for all games together.
+    Board values are 0 for vacant and 1/2 for players (row 0 is the top row, like in Game).
+    """
+
+    # Winner value of games that are not finished yet (0 is a tie, 1/2 the winning player, like in Game).
+    ONGOING = -1
+    # Directions (row change, col change) to check for combinations - horizontal, vertical and both diagonals.
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, size, first_player=None, seed=None):
+        """
+        Init method for GameBatch objects: Assigns batch arrays and starts all games.
+        :param size: (int) of number of games in batch.
+        :param first_player: (int) in range (1-2) of player to start each game. default=None: random per game.
+        :param seed: (int) seed for the random generator of first players and random moves. default=None.
+        """
+        if size < 1:
+            raise Exception('Batch size must be positive.')
+        self.__size = size
+        self.__first_player_setting = first_player
+        self.__rng = np.random.default_rng(seed)
+        self.__board = np.zeros((size, data.BOARD_ROWS, data.BOARD_COLS), dtype=np.int8)
+        # Number of discs in each column - the next disc in column lands in row (LAST_IDX_ROW - height).
+        self.__heights = np.zeros((size, data.BOARD_COLS), dtype=np.int8)
+        self.__first_player = np.ones(size, dtype=np.int8)
+        self.__current_player = np.ones(size, dtype=np.int8)
+        self.__turns = np.zeros(size, dtype=np.int16)
+        self.__winner = np.full(size, GameBatch.ONGOING, dtype=np.int8)
+        # Columns played in each game, in order (-1 for moves not played yet).
+        self.__moves = np.full((size, data.BOARD_ROWS * data.BOARD_COLS), -1, dtype=np.int8)
+        self.reset()
+
+    def reset(self, games=None):
+        """
+        Resets given games to an empty board with a new first player.
+        :param games: (array) of game indexes or boolean mask of games to reset. default=None: all games.
+        """
+        games = np.arange(self.__size) if games is None else np.asarray(games)
+        if games.dtype == bool:
+            games = np.flatnonzero(games)
+        self.__board[games] = 0
+        self.__heights[games] = 0
+        self.__turns[games] = 0
+        self.__winner[games] = GameBatch.ONGOING
+        self.__moves[games] = -1
+        if self.__first_player_setting is None:
+            self.__first_player[games] = self.__rng.integers(1, 3, size=len(games))
+        else:
+            self.__first_player[games] = self.__first_player_setting
+        self.__current_player[games] = self.__first_player[games]
+
+    def reset_finished(self):
+        """
+        Resets all finished games (won or tied), so the batch keeps stepping K live games.
+        :return: (array) of (int) containing winners of the reset games (0 for tie).
+        """
+        finished = self.__winner != GameBatch.ONGOING
+        winners = self.__winner[finished].copy()
+        self.reset(finished)
+        return winners
+
+    def legal_moves(self):
+        """
+        Returns mask of legal moves for all games. Finished games have no legal moves.
+        :return: (array) of (bool) of shape (K, cols), True if column has vacant row.
+        """
+        return (self.__heights < data.BOARD_ROWS) & (self.__winner == GameBatch.ONGOING)[:, None]
+
+    def make_moves(self, cols):
+        """
+        Moves the current player of each ongoing game to given column, then checks for win or tie.
+        Finished games are skipped, so their column value is ignored.
+        :param cols: (array) of (int) of shape (K,) containing column to move to in each game.
+        :return: (array) of (bool) of shape (K,), True for games that were finished by this move.
+        Raise exception if any column is not legal in its ongoing game.
+        """
+        cols = np.asarray(cols)
+        games = np.flatnonzero(self.__winner == GameBatch.ONGOING)
+        cols = cols[games]
+        if np.any((cols < 0) | (cols > data.LAST_IDX_COL)):
+            raise Exception('Position not existent.')
+        if np.any(self.__heights[games, cols] >= data.BOARD_ROWS):
+            raise Exception('Illegal move.')
+        rows = data.LAST_IDX_ROW - self.__heights[games, cols]
+        players = self.__current_player[games]
+        self.__board[games, rows, cols] = players
+        self.__heights[games, cols] += 1
+        self.__moves[games, self.__turns[games]] = cols
+        self.__turns[games] += 1
+        # Assigns winners: player if a combination was made, 0 if board is full, ONGOING otherwise.
+        won = self._combination_checker(games, rows, cols, players)
+        full = self.__turns[games] == data.BOARD_ROWS * data.BOARD_COLS
+        self.__winner[games] = np.where(won, players, np.where(full, 0, GameBatch.ONGOING))
+        # Switches player in all games (finished games keep current player from before).
+        self.__current_player[games] = np.where(won | full, players, 3 - players)
+        finished = np.zeros(self.__size, dtype=bool)
+        finished[games] = won | full
+        return finished
+
+    def random_moves(self):
+        """
+        Chooses a random legal column for each game.
+        :return: (array) of (int) of shape (K,) containing columns (0 for finished games).
+        """
+        return np.argmax(self.__rng.random((self.__size, data.BOARD_COLS)) * self.legal_moves(), axis=1)
+
+    def ai_moves(self, cache=None):
+        """
+        Chooses a column for each ongoing game with the AI heuristic, by replaying each game into a Game object.
+        :param cache: (EvalCache) object for AI to store position scores in. default=None: the process-wide cache.
+        :return: (array) of (int) of shape (K,) containing columns (0 for finished games).
+        """
+        cols = np.zeros(self.__size, dtype=np.int8)
+        for idx in np.flatnonzero(self.__winner == GameBatch.ONGOING):
+            game = self.to_game(idx)
+            # Seeds each AI from batch generator, so a seeded batch replays the same AI moves.
+            seed = int(self.__rng.integers(2 ** 63))
+            cols[idx] = AI(game, game.get_current_player(), cache, seed).find_legal_move()
+        return cols
+
+    def to_game(self, idx):
+        """
+        Creates Game object with the same moves of given game in batch.
+        :param idx: (int) of game index in batch.
+        :return: (Game) object replaying this game.
+        """
+        game = Game(int(self.__first_player[idx]))
+        for col in self.__moves[idx, :self.__turns[idx]]:
+            game.make_move(int(col))
+            game.add_turn()
+        return game
+
+    def get_size(self):
+        return self.__size
+
+    def get_boards(self):
+        return self.__board
+
+    def get_current_players(self):
+        return self.__current_player
+
+    def get_winners(self):
+        return self.__winner
+
+    def get_turns(self):
+        return self.__turns
+
+    def get_moves(self):
+        return self.__moves
+
+    def _combination_checker(self, games, rows, cols, players):
+        """
+        Private method for make_moves(). Checks if the discs just placed made a combination in any direction,
+        by counting same player discs on both sides of the disc (up to COMBO_STEP each side).
+        :param games: (array) of (int) of game indexes.
+        :param rows: (array) of (int) of rows of the placed discs.
+        :param cols: (array) of (int) of columns of the placed discs.
+        :param players: (array) of (int) of players that placed the discs.
+        :return: (array) of (bool), True for games where a combination was made.
+        """
+        won = np.zeros(len(games), dtype=bool)
+        for r_change, c_change in GameBatch.DIRECTIONS:
+            count = np.ones(len(games), dtype=np.int8)
+            for side in (1, -1):
+                # Stays True while all positions so far on this side are in board and belong to player.
+                in_row = np.ones(len(games), dtype=bool)
+                for step in range(1, data.COMBINATION_NUM):
+                    row = rows + side * step * r_change
+                    col = cols + side * step * c_change
+                    in_range = (row >= 0) & (row <= data.LAST_IDX_ROW) & (col >= 0) & (col <= data.LAST_IDX_COL)
+                    in_row &= in_range
+                    in_row &= self.__board[games, np.where(in_range, row, 0), np.where(in_range, col, 0)] == players
+                    count += in_row
+            won |= count >= data.COMBINATION_NUM
+        return won
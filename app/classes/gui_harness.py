@@ -0,0 +1,204 @@
+from ..data import game_data as data
+from .screen import Screen
+from .game import Game
+from .match_stats import MatchStats
+from .seed_stream import SeedStream
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+
+
+class GuiHarness:
+    """
+    This classes measures the cost of the GUI: It drives Screen and ScreenGame without user input (in a withdrawn,
+    not full screen window, under a virtual X server if there is no display), plays scripted games between two
+    human players, and records after each move the redraw latency (separately from the disc drop animation), number
+    of live widgets, PhotoImage objects, pending after() callbacks and process memory (RSS), so leaks and slowdowns
+    can be tracked over time. Harness games are recorded in a temporary match statistics store, not the real one.
+    """
+
+    def __init__(self, fast=True, display=':99'):
+        """
+        Init method for GuiHarness objects: Starts virtual X server if needed, a temporary match statistics store,
+        and the screens (without main loop).
+        :param fast: (boolean) True to shorten the game's delays (game_data BASE_SPEED and TRANSITION_SPEED) to 1 ms,
+        so the harness doesn't wait between games (restored by close()). default=True.
+        :param display: (str) of X display for virtual X server, if started. default=':99'.
+        """
+        self.__xvfb = None
+        if os.name == 'posix' and not os.environ.get('DISPLAY'):
+            self._start_xvfb(display)
+        # Game delays, to restore on close().
+        self.__delays = (data.BASE_SPEED, data.TRANSITION_SPEED)
+        if fast:
+            data.BASE_SPEED = 1
+            data.TRANSITION_SPEED = 1
+        # Match statistics store of harness games, in a temporary directory removed on close().
+        self.__stats_dir = tempfile.TemporaryDirectory()
+        self.__stats = MatchStats(os.path.join(self.__stats_dir.name, 'match_stats.db'))
+        self.__previous_stats = MatchStats.set_shared(self.__stats)
+        self.__screen = Screen(full_screen=False, run=False)
+        self.__root = self.__screen.get_root()
+        self.__root.withdraw()
+
+    @staticmethod
+    def scripted_games(count, seed=None):
+        """
+        Creates move scripts of random legal games, played until win or tie. Each game's moves come from its own
+        seed derived from base seed, so any game can be recreated alone.
+        :param count: (int) of number of games.
+        :param seed: (int) base seed for game moves. default=None: random base seed.
+        :return: (list) of (lists) of (int) of columns played, in order (player 1 first).
+        """
+        seeds = SeedStream(seed)
+        scripts = []
+        for idx in range(count):
+            rng = random.Random(seeds.seed_for('game', idx))
+            game = Game(1)
+            winner = None
+            while winner is None:
+                game.make_move(rng.choice([col for col in range(data.BOARD_COLS)
+                                           if game.get_player_at(0, col) == data.INITIAL_VAL]))
+                winner = game.get_winner()
+                game.add_turn()
+            scripts.append(game.get_move_history())
+        return scripts
+
+    def run(self, scripts, timeout=30.0):
+        """
+        Plays given scripts as consecutive games (the first from main menu, the others with PLAY AGAIN), recording
+        GUI measures after each move.
+        :param scripts: (list) of (lists) of (int) of columns played, in order (player 1 first).
+        :param timeout: (float) of max seconds to wait for a redraw or screen change.
+        :return: (dict) containing games (moves, measures and animation frame statistics of each game) and summary
+        (average and max redraw latency, animation frames, and measures at start and end, to compare).
+        """
+        start_measures = self._measure()
+        games = []
+        screen_game = None
+        for script in scripts:
+            if screen_game is None:
+                screen_game = self.__screen.get_menu().start_game()
+            else:
+                screen_game = screen_game.get_win_screen().play_again()
+            games.append(self._play(screen_game, script, timeout))
+            # Waits for winner banner and win screen, so their widgets and callbacks are measured too.
+            self._wait(lambda: screen_game.get_win_screen() is not None, timeout)
+        end_measures = self._measure()
+        latencies = [move['redraw_ms'] for game in games for move in game['moves']]
+        frames = [game['frames'] for game in games]
+        frames_count = sum(game_frames['frames'] for game_frames in frames)
+        return {'games': games, 'summary': {
+            'games': len(games), 'moves': len(latencies), 'avg_redraw_ms': sum(latencies) / len(latencies)
+            if latencies else 0, 'max_redraw_ms': max(latencies, default=0), 'frames': {
+                'frames': frames_count, 'avg_ms': sum(game_frames['total_ms'] for game_frames in frames) / frames_count
+                if frames_count else 0, 'max_ms': max((game_frames['max_ms'] for game_frames in frames), default=0),
+                'over_budget': sum(game_frames['over_budget'] for game_frames in frames)},
+            'start': start_measures, 'end': end_measures}}
+
+    def close(self):
+        """
+        Destroys the screens, restores game delays and shared match statistics store, removes temporary store and
+        stops virtual X server, if started.
+        """
+        self.__root.destroy()
+        data.BASE_SPEED, data.TRANSITION_SPEED = self.__delays
+        MatchStats.set_shared(self.__previous_stats)
+        self.__stats.close()
+        self.__stats_dir.cleanup()
+        if self.__xvfb is not None:
+            self.__xvfb.terminate()
+            self.__xvfb.wait()
+
+    def _play(self, screen_game, script, timeout):
+        """
+        Private method that plays a script on a game screen. Each move's redraw is timed from the click until its
+        handling and pending redraws are done - without the disc drop animation, which takes a fixed time (its frames
+        are measured by the board canvas frame statistics).
+        :param screen_game: (ScreenGame) object of new game.
+        :param script: (list) of (int) of columns played, in order.
+        :param timeout: (float) of max seconds to wait for a redraw.
+        :return: (dict) containing winner, list of moves with measures and animation frame statistics.
+        """
+        # Both players are human, so the script's columns are played whoever the game's first player is.
+        game = screen_game.get_game()
+        moves = []
+        for ply, col in enumerate(script):
+            start = time.perf_counter()
+            screen_game.click_col(col)
+            self.__root.update_idletasks()
+            redraw_ms = (time.perf_counter() - start) * 1000
+            # Lets the disc land (board is redrawn when it lands, and winner banner is scheduled after the last disc)
+            # before the next move.
+            self._wait(lambda: not screen_game.get_board_canvas().is_dropping(), timeout)
+            self.__root.update_idletasks()
+            measures = self._measure()
+            measures.update({'ply': ply, 'col': col, 'redraw_ms': redraw_ms,
+                             'drop_ms': (time.perf_counter() - start) * 1000})
+            moves.append(measures)
+        return {'first_player': game.get_first_player(), 'winner': screen_game.get_winner(), 'moves': moves,
+                'frames': screen_game.get_board_canvas().get_frame_stats()}
+
+    def _wait(self, done, timeout):
+        """
+        Private method that processes Tkinter events until given condition is true.
+        :param done: (function) that returns (boolean) True when done.
+        :param timeout: (float) of max seconds to wait.
+        :return: raise exception if timed out.
+        """
+        deadline = time.perf_counter() + timeout
+        while not done():
+            if time.perf_counter() > deadline:
+                raise Exception('GUI did not respond in time.')
+            self.__root.update()
+            time.sleep(0.001)
+
+    def _measure(self):
+        """
+        Private method that measures current GUI state.
+        :return: (dict) containing widgets, images, after callbacks and rss_kb.
+        """
+        return {'widgets': GuiHarness._count_widgets(self.__root),
+                'images': len(self.__root.tk.splitlist(self.__root.tk.call('image', 'names'))),
+                'after_callbacks': len(self.__root.tk.splitlist(self.__root.tk.call('after', 'info'))),
+                'rss_kb': GuiHarness._rss_kb()}
+
+    @staticmethod
+    def _count_widgets(widget):
+        """
+        Private recursive method that counts given widget and all widgets under it.
+        :param widget: Tkinter widget.
+        :return: (int) of number of widgets.
+        """
+        return 1 + sum(GuiHarness._count_widgets(child) for child in widget.winfo_children())
+
+    @staticmethod
+    def _rss_kb():
+        """
+        Private method that reads this process's resident memory size (Linux only).
+        :return: (int) of kB, or None if not available.
+        """
+        try:
+            with open('/proc/self/status') as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])
+        except OSError:
+            return None
+
+    def _start_xvfb(self, display):
+        """
+        Private method that starts a virtual X server and sets DISPLAY to it.
+        :param display: (str) of X display to start.
+        :return: raise exception if Xvfb is not installed.
+        """
+        if shutil.which('Xvfb') is None:
+            raise Exception('No display, and Xvfb is not installed.')
+        self.__xvfb = subprocess.Popen(['Xvfb', display, '-screen', '0', '1920x1080x24'],
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.environ['DISPLAY'] = display
+        # Gives server time to accept connections.
+        time.sleep(1)
@@ -0,0 +1,209 @@
+from ..data import game_data as data
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+
+
+class MatchStats:
+    """
+    This classes stores match statistics persistently in an SQLite file: each finished game's player types, first
+    player, winner and number of moves, and the time each AI move took. Games are queued and written by a background
+    thread in batches (one transaction per batch), so recording a game never blocks the GUI or a simulation loop.
+    """
+
+    # The shared store instance, created on first use by shared() method.
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    # Tables and indexes for aggregate queries by player type.
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY, played_at REAL, player1_type TEXT, '
+        'player2_type TEXT, first_player INTEGER, winner INTEGER, moves INTEGER)',
+        'CREATE TABLE IF NOT EXISTS ai_moves (game_id INTEGER, ply INTEGER, player INTEGER, player_type TEXT, '
+        'latency_ms REAL)',
+        'CREATE INDEX IF NOT EXISTS games_player1 ON games (player1_type, winner)',
+        'CREATE INDEX IF NOT EXISTS games_player2 ON games (player2_type, winner)',
+        'CREATE INDEX IF NOT EXISTS ai_moves_type ON ai_moves (player_type, latency_ms)',
+    )
+
+    def __init__(self, path=data.STATS_FILE, batch_size=data.STATS_BATCH_SIZE, flush_time=data.STATS_FLUSH_TIME):
+        """
+        Init method for MatchStats objects: Creates games queue and writer thread. The writer thread opens the
+        database and creates its tables (if needed), so creating a store never waits for the disk.
+        :param path: (str) containing path of SQLite file.
+        :param batch_size: (int) of max number of games written in one transaction.
+        :param flush_time: (float) of seconds the writer waits for more games before writing a batch.
+        """
+        self.__path = path
+        self.__batch_size = batch_size
+        self.__flush_time = flush_time
+        # Set by writer thread when database tables exist (or it failed to create them), so queries can run.
+        self.__ready = threading.Event()
+        # Error of writer thread if it failed to open the database, raised by queries.
+        self.__error = None
+        # Queue of games to write (None to stop the writer).
+        self.__queue = queue.Queue()
+        self.__writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.__writer.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def set_shared(stats):
+        """
+        Replaces the process-wide store instance, e.g. so a benchmark records its games in a store of its own.
+        :param stats: (MatchStats) object to share, or None to create default store on next use.
+        :return: (MatchStats) object shared before, or None.
+        """
+        with MatchStats.__shared_lock:
+            previous = MatchStats.__shared
+            MatchStats.__shared = stats
+            return previous
+
+    @staticmethod
+    def shared():
+        """
+        Returns the process-wide store instance, creating it with default game data settings if needed.
+        :return: (MatchStats) object shared by all screens.
+        """
+        with MatchStats.__shared_lock:
+            if MatchStats.__shared is None:
+                MatchStats.__shared = MatchStats()
+            return MatchStats.__shared
+
+    def record_game(self, player_types, first_player, winner, moves, ai_latencies=()):
+        """
+        Queues a finished game to be written. Returns immediately.
+        :param player_types: (dict) of (int) player: (str) player type, e.g. {1: 'human', 2: 'AI'}.
+        :param first_player: (int) in range (1-2) of player who made the first move.
+        :param winner: (int) in range (0-2) of the player who won (0 for tie).
+        :param moves: (int) of number of moves in game.
+        :param ai_latencies: (list) of (tuples) of (int) ply, (int) player and (float) ms AI took to choose move.
+        """
+        # Writer thread failed - games are not kept, so the queue doesn't grow with nothing to write it.
+        if self.__error is not None:
+            return
+        self.__queue.put((time.time(), player_types[1], player_types[2], first_player, winner, moves,
+                          [(ply, player, player_types[player], ms) for ply, player, ms in ai_latencies]))
+
+    def flush(self):
+        """
+        Waits until all queued games are written.
+        """
+        if self.__writer.is_alive():
+            self.__queue.join()
+
+    def close(self):
+        """
+        Writes all queued games and stops the writer thread.
+        """
+        if self.__writer.is_alive():
+            self.__queue.put(None)
+            self.__writer.join()
+
+    def get_results(self):
+        """
+        Returns results per player type, of all recorded games (queued games are written first).
+        :return: (dict) of (str) player type: (dict) containing games, wins, losses and ties.
+        """
+        rows = self._query('SELECT type, COUNT(*), SUM(winner = player), SUM(winner != player AND winner != 0), '
+                           'SUM(winner = 0) FROM (SELECT player1_type AS type, 1 AS player, winner FROM games '
+                           'UNION ALL SELECT player2_type, 2, winner FROM games) GROUP BY type')
+        return {row[0]: {'games': row[1], 'wins': row[2], 'losses': row[3], 'ties': row[4]} for row in rows}
+
+    def get_move_counts(self):
+        """
+        Returns number of moves per game for each pair of player types.
+        :return: (dict) of (tuple) of (str) player 1 type and player 2 type: (dict) containing games, average,
+        min and max moves.
+        """
+        rows = self._query('SELECT player1_type, player2_type, COUNT(*), AVG(moves), MIN(moves), MAX(moves) '
+                           'FROM games GROUP BY player1_type, player2_type')
+        return {(row[0], row[1]): {'games': row[2], 'avg': row[3], 'min': row[4], 'max': row[5]} for row in rows}
+
+    def get_latencies(self):
+        """
+        Returns AI move time statistics for each AI player type.
+        :return: (dict) of (str) player type: (dict) containing moves, average and max ms per move.
+        """
+        rows = self._query('SELECT player_type, COUNT(*), AVG(latency_ms), MAX(latency_ms) FROM ai_moves '
+                           'GROUP BY player_type')
+        return {row[0]: {'moves': row[1], 'avg_ms': row[2], 'max_ms': row[3]} for row in rows}
+
+    def _connect(self):
+        """
+        Private method that opens a connection to the database. Write-ahead logging lets queries read while the
+        writer thread writes.
+        :return: (Connection) SQLite object.
+        """
+        connection = sqlite3.connect(self.__path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    def _query(self, sql):
+        """
+        Private method that writes queued games, then runs a query on its own connection.
+        :param sql: (str) of query.
+        :return: (list) of (tuples) of result rows, or raise writer thread's error if it failed to open database.
+        """
+        self.flush()
+        self.__ready.wait()
+        if self.__error is not None:
+            raise self.__error
+        connection = self._connect()
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def _write_loop(self):
+        """
+        Private method of the writer thread: Collects queued games until batch is full or no game came within
+        flush time, and writes them in one transaction. If database can't be opened, keeps the error for queries and
+        stops (queued games are dropped).
+        """
+        try:
+            connection = self._connect()
+            with connection:
+                for statement in MatchStats.SCHEMA:
+                    connection.execute(statement)
+        except Exception as error:
+            self.__error = error
+            self.__ready.set()
+            self._drop_queued()
+            return
+        self.__ready.set()
+        stop = False
+        while not stop:
+            batch = [self.__queue.get()]
+            while batch[-1] is not None and len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get(timeout=self.__flush_time))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            games = [game for game in batch if game is not None]
+            if games:
+                with connection:
+                    for game in games:
+                        game_id = connection.execute('INSERT INTO games (played_at, player1_type, player2_type, '
+                                                     'first_player, winner, moves) VALUES (?, ?, ?, ?, ?, ?)',
+                                                     game[:6]).lastrowid
+                        connection.executemany('INSERT INTO ai_moves VALUES (?, ?, ?, ?, ?)',
+                                               [(game_id,) + move for move in game[6]])
+            for _ in batch:
+                self.__queue.task_done()
+        connection.close()
+
+    def _drop_queued(self):
+        """
+        Private method that empties games queue (marking each game as done, so flush() doesn't wait for it).
+        """
+        while True:
+            try:
+                self.__queue.get_nowait()
+            except queue.Empty:
+                return
+            self.__queue.task_done()
@@ -0,0 +1,208 @@
+from ..data import game_data as data
+from .board import Board
+import math
+import random
+import time
+
+
+class MCTS:
+    """
+    This classes creates an alternative AI player using Monte Carlo Tree Search (UCT): Plays many fast rollouts on a
+    compact Board and chooses the most visited move. The subtree under the played moves is kept for the next move.
+    """
+
+    def __init__(self, game, player, playouts=data.MCTS_PLAYOUTS, time_limit=None, heuristic_rollouts=True,
+                 seed=None):
+        """
+        Init method for MCTS objects: Assigns Game object, player, search budget, random generator and empty tree.
+        :param game: (Game) object with this game logic.
+        :param player: (int) in range (1-2) containing player number.
+        :param playouts: (int) of max playouts per move. None for no playouts limit (time_limit must be set).
+        :param time_limit: (float) of max seconds per move. default=None: no time limit.
+        :param heuristic_rollouts: (boolean) True to win or block immediate wins in rollouts, False for random.
+        :param seed: (int) seed for this player's random generator, to reproduce its moves. default=None: unseeded.
+        """
+        if playouts is None and time_limit is None:
+            raise Exception('No playouts or time limit.')
+        self.__game = game
+        self.__player = player
+        self.__playouts = playouts
+        self.__time_limit = time_limit
+        self.__heuristic_rollouts = heuristic_rollouts
+        self.__rng = random.Random(seed)
+        # Search tree root and the board position of root, kept between moves for tree reuse.
+        self.__root = None
+        self.__root_board = None
+        self.__last_found_move = None
+        self.__stats = {'playouts': 0, 'time': 0.0, 'reused_visits': 0}
+
+    def find_legal_move(self, timeout=None):
+        """
+        Runs playouts from current position until playouts budget or time limit is over, and returns the most
+        visited column.
+        :param timeout: (float) of max seconds for this move, overrides time limit if smaller.
+        :return: (int) of column to go to.
+        """
+        if self.__game.get_current_player() != self.__player:
+            raise Exception('Wrong Player.')
+        board = Board.from_game(self.__game)
+        if not board.legal_cols():
+            raise Exception('No possible AI moves.')
+        start = time.perf_counter()
+        time_limit = min(limit for limit in (self.__time_limit, timeout, math.inf) if limit is not None)
+        deadline = start + time_limit if time_limit != math.inf else None
+        self._reuse_tree(board)
+        playouts = 0
+        while self.__playouts is None or playouts < self.__playouts:
+            # Checks time every few playouts - time.perf_counter() costs more than a rollout step.
+            if deadline is not None and playouts % 16 == 0 and time.perf_counter() > deadline:
+                break
+            self._playout(board)
+            playouts += 1
+        self.__stats['playouts'] += playouts
+        self.__stats['time'] += time.perf_counter() - start
+        # No playouts were made (e.g. very short timeout) - chooses a random legal column, like AI does.
+        if not self.__root.children:
+            cols = board.legal_cols()
+            self.__last_found_move = cols[self.__rng.randrange(len(cols))]
+            return self.__last_found_move
+        # Chooses the most visited child - the most reliable estimate.
+        best = max(self.__root.children, key=lambda child: child.visits)
+        self.__last_found_move = best.col
+        return self.__last_found_move
+
+    def get_last_found_move(self):
+        return self.__last_found_move
+
+    def get_stats(self):
+        """
+        Returns playouts statistics, summed over all moves.
+        :return: (dict) containing playouts, time, playouts per second and visits reused from previous moves' trees.
+        """
+        stats = dict(self.__stats)
+        stats['pps'] = stats['playouts'] / stats['time'] if stats['time'] else 0
+        return stats
+
+    def _reuse_tree(self, board):
+        """
+        Private method that makes the tree node of given position the new root, if it is in the tree (up to 2 moves
+        below root: this player's move and the other player's reply). If not, starts a new tree.
+        :param board: (Board) object of current position.
+        """
+        node = None
+        if self.__root is not None:
+            key = board.get_key()
+            old_board = self.__root_board
+            for child in self.__root.children:
+                old_board.play(child.col)
+                if old_board.get_key() == key:
+                    node = child
+                for grandchild in child.children:
+                    old_board.play(grandchild.col)
+                    if old_board.get_key() == key:
+                        node = grandchild
+                    old_board.undo()
+                old_board.undo()
+        if node is None:
+            node = _Node(None, None, 3 - board.get_current_player())
+        else:
+            self.__stats['reused_visits'] += node.visits
+            node.parent = None
+        if node.untried is None:
+            node.untried = board.legal_cols()
+        self.__root = node
+        self.__root_board = board.copy()
+
+    def _playout(self, board):
+        """
+        Private method that runs a single playout: selects a path down the tree by UCT, expands one new node,
+        plays a rollout to game end, and updates the nodes on the path with the result.
+        :param board: (Board) object of root position (restored to same position when done).
+        """
+        node = self.__root
+        moves = 0
+        # Selection - while all moves of node were tried, goes to child with best UCT value.
+        while not node.untried and node.children and node.winner is None:
+            log_visits = math.log(node.visits)
+            node = max(node.children, key=lambda child: child.wins / child.visits +
+                       data.MCTS_EXPLORATION * math.sqrt(log_visits / child.visits))
+            board.play(node.col)
+            moves += 1
+        # Expansion - adds child of a random untried move.
+        if node.untried and node.winner is None:
+            col = node.untried.pop(self.__rng.randrange(len(node.untried)))
+            player = board.get_current_player()
+            board.play(col)
+            moves += 1
+            child = _Node(col, node, player)
+            if board.last_move_won():
+                child.winner = player
+            elif board.is_full():
+                child.winner = 0
+            else:
+                child.untried = board.legal_cols()
+            node.children.append(child)
+            node = child
+        # Rollout - plays to the end of game, unless node is already a finished game.
+        winner, rollout_moves = (node.winner, 0) if node.winner is not None else self._rollout(board)
+        moves += rollout_moves
+        # Backpropagation - each node is scored for the player who moved into it (tie counts as half a win).
+        while node is not None:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1
+            elif winner == 0:
+                node.wins += 0.5
+            node = node.parent
+        for _ in range(moves):
+            board.undo()
+
+    def _rollout(self, board):
+        """
+        Private method that plays random moves to the end of game. With heuristic rollouts, a player takes an
+        immediate win if it has one, or else blocks the other player's immediate win.
+        :param board: (Board) object to play on (moves are left for caller to undo).
+        :return: (tuple) of (int) winner (0 for tie) and (int) of number of moves played.
+        """
+        moves = 0
+        while True:
+            cols = board.legal_cols()
+            if not cols:
+                return 0, moves
+            player = board.get_current_player()
+            col = None
+            if self.__heuristic_rollouts:
+                col = next((col for col in cols if board.is_winning_move(col)), None)
+                if col is None:
+                    col = next((col for col in cols if board.is_winning_move(col, 3 - player)), None)
+            if col is None:
+                col = cols[self.__rng.randrange(len(cols))]
+            board.play(col)
+            moves += 1
+            if board.last_move_won():
+                return player, moves
+
+
+class _Node:
+    """
+    Private classes for MCTS search tree nodes.
+    """
+    __slots__ = ('col', 'parent', 'player', 'children', 'untried', 'visits', 'wins', 'winner')
+
+    def __init__(self, col, parent, player):
+        """
+        Init method for tree nodes.
+        :param col: (int) of column of the move into this node (None for root).
+        :param parent: (_Node) object of parent node (None for root).
+        :param player: (int) in range (1-2) of player who made the move into this node.
+        """
+        self.col = col
+        self.parent = parent
+        self.player = player
+        self.children = []
+        # Legal moves without child nodes yet (None until node position is known).
+        self.untried = None
+        self.visits = 0
+        self.wins = 0.0
+        # Winner if this node is a finished game (0 for tie), None if otherwise.
+        self.winner = None
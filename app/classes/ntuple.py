@@ -0,0 +1,255 @@
+from ..data import game_data as data
+from .board import Board
+import numpy as np
+
+
+class NTupleEvaluator:
+    """
+    This classes evaluates positions with NumPy lookup tables over board patterns (n-tuples): Each winning line is a
+    tuple of 4 positions, and its pattern of vacant/player 1/player 2 positions indexes a table of learned weights.
+    A line and its mirror image share one table. The position value (for player 1, from -1 to 1) is the sum of the
+    weights of all line patterns.
+    """
+
+    # Number of states of a board position - vacant, player 1, player 2.
+    STATES = 3
+
+    def __init__(self, weights=None):
+        """
+        Init method for NTupleEvaluator objects: Assigns lines (as flat board indexes), their tables and weights.
+        :param weights: (array) of weights of shape (tables, 3 ** COMBINATION_NUM). default=None: zero weights.
+        """
+        self.__lines, self.__tables = NTupleEvaluator._create_tuples()
+        shape = (self.__tables.max() + 1, NTupleEvaluator.STATES ** data.COMBINATION_NUM)
+        if weights is None:
+            weights = np.zeros(shape, dtype=np.float32)
+        elif weights.shape != shape:
+            raise Exception('Weights do not match board.')
+        self.__weights = weights
+        # Multiplier of each tuple position's state, to get pattern index in table.
+        self.__powers = NTupleEvaluator.STATES ** np.arange(data.COMBINATION_NUM)
+
+    @staticmethod
+    def load(path):
+        """
+        Creates evaluator with weights loaded from binary file saved with save() method.
+        :param path: (str) containing path of weights file (exactly as given to save()).
+        :return: (NTupleEvaluator) object.
+        """
+        with open(path, 'rb') as weights_file:
+            return NTupleEvaluator(np.load(weights_file))
+
+    def save(self, path):
+        """
+        Saves weights to compact binary file (NumPy .npy format of float32). Written through a file object, so the
+        file gets exactly the given path (np.save adds '.npy' to a path without it).
+        :param path: (str) containing path of weights file.
+        """
+        with open(path, 'wb') as weights_file:
+            np.save(weights_file, self.__weights.astype(np.float32))
+
+    def get_weights(self):
+        return self.__weights
+
+    @staticmethod
+    def cells_of(game):
+        """
+        Returns board positions of given Game object, in the flat form used by evaluator.
+        :param game: (Game) object.
+        :return: (array) of (int8) of shape (rows * cols,) - 0 for vacant, 1/2 for players.
+        """
+        return np.array([[val if val in (1, 2) else 0 for val in row] for row in game.get_board()],
+                        dtype=np.int8).ravel()
+
+    def patterns(self, cells):
+        """
+        Returns pattern index of each line in given board.
+        :param cells: (array) of flat board positions (see cells_of()).
+        :return: (array) of (int) pattern index of each line in its table.
+        """
+        return cells[self.__lines] @ self.__powers
+
+    def evaluate(self, cells):
+        """
+        Returns value of given board for player 1 - the sum of its line patterns' weights.
+        :param cells: (array) of flat board positions (see cells_of()).
+        :return: (float) of position value, from -1 (player 2 wins) to 1 (player 1 wins).
+        """
+        return float(self.__weights[self.__tables, self.patterns(cells)].sum())
+
+    def update(self, cells, error):
+        """
+        Moves the value of given board towards a target, by adding the value error to the weights of its patterns.
+        :param cells: (array) of flat board positions (see cells_of()).
+        :param error: (float) of target value minus current value, times learning rate.
+        """
+        # Spreads the error between the patterns (np.add.at adds repeated table entries more than once).
+        np.add.at(self.__weights, (self.__tables, self.patterns(cells)), error / len(self.__lines))
+
+    def choose_move(self, cells, heights, player, rng=None, exploration=0.0):
+        """
+        Chooses column for given player: An immediate win if there is one, otherwise the column with the best
+        evaluated position after the move (or a random column, with chance of exploration).
+        :param cells: (array) of flat board positions (see cells_of()), restored when done.
+        :param heights: (list) of (int) of number of discs in each column.
+        :param player: (int) in range (1-2) of player to move.
+        :param rng: (Generator) NumPy random generator for exploration and ties. default=None: new unseeded one.
+        :param exploration: (float) of chance to choose a random column.
+        :return: (int) of column to go to.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        cols = [col for col in range(data.BOARD_COLS) if heights[col] < data.BOARD_ROWS]
+        if exploration and rng.random() < exploration:
+            return int(rng.choice(cols))
+        sign = 1 if player == 1 else -1
+        best_cols, best_value = [], None
+        for col in cols:
+            pos = (data.LAST_IDX_ROW - heights[col]) * data.BOARD_COLS + col
+            cells[pos] = player
+            won = self.is_win(cells, pos)
+            value = sign * self.evaluate(cells) if not won else np.inf
+            cells[pos] = 0
+            if best_value is None or value > best_value:
+                best_cols, best_value = [col], value
+            elif value == best_value:
+                best_cols.append(col)
+        return int(best_cols[rng.integers(len(best_cols))])
+
+    def is_win(self, cells, pos):
+        """
+        Checks if the disc in given position makes a combination.
+        :param cells: (array) of flat board positions (see cells_of()).
+        :param pos: (int) of flat index of the disc.
+        :return: (boolean) True if a line through position is full of the disc's player.
+        """
+        lines = self.__lines[np.any(self.__lines == pos, axis=1)]
+        return bool(np.any(np.all(cells[lines] == cells[pos], axis=1)))
+
+    @staticmethod
+    def _create_tuples():
+        """
+        Private method that creates the n-tuples: Each winning line as flat board indexes, and its table number.
+        A line and its mirror image get the same table, with positions ordered so mirrored positions match.
+        :return: (tuple) of (array) of shape (lines, COMBINATION_NUM) of flat indexes and (array) of table numbers.
+        """
+        tables, lines, table_of = {}, [], []
+        for line in Board.winning_lines():
+            mirror = sorted((row, data.LAST_IDX_COL - col) for row, col in line)
+            canonical = min(sorted(line), mirror)
+            # Orders this line's positions as the canonical line's positions (mirrored if line is the mirror).
+            order = canonical if canonical == sorted(line) else [(row, data.LAST_IDX_COL - col)
+                                                                 for row, col in canonical]
+            table_of.append(tables.setdefault(tuple(canonical), len(tables)))
+            lines.append([row * data.BOARD_COLS + col for row, col in order])
+        return np.array(lines), np.array(table_of)
+
+
+class NTupleTrainer:
+    """
+    This classes trains NTupleEvaluator weights offline from headless self-play, with temporal-difference learning:
+    After each move, the value of the position after the previous move is moved towards the value of the position
+    after this move (or towards the game result, when game ends).
+    """
+
+    def __init__(self, evaluator=None, learning_rate=data.NTUPLE_LEARNING_RATE, exploration=data.NTUPLE_EXPLORATION,
+                 seed=None):
+        """
+        Init method for NTupleTrainer objects.
+        :param evaluator: (NTupleEvaluator) object to train. default=None: new evaluator with zero weights.
+        :param learning_rate: (float) of TD learning rate.
+        :param exploration: (float) of chance of random move in self-play.
+        :param seed: (int) seed for self-play random generator. default=None: unseeded.
+        """
+        self.__evaluator = evaluator if evaluator is not None else NTupleEvaluator()
+        self.__learning_rate = learning_rate
+        self.__exploration = exploration
+        self.__rng = np.random.default_rng(seed)
+        self.__results = {0: 0, 1: 0, 2: 0}
+
+    def get_evaluator(self):
+        return self.__evaluator
+
+    def get_results(self):
+        return dict(self.__results)
+
+    def train(self, games):
+        """
+        Plays given number of self-play games, updating evaluator weights after each move.
+        :param games: (int) of number of games.
+        """
+        for _ in range(games):
+            self.__results[self._play_game()] += 1
+
+    def _play_game(self):
+        """
+        Private method that plays a single self-play game with TD(0) updates.
+        :return: (int) of winner (0 for tie).
+        """
+        evaluator = self.__evaluator
+        cells = np.zeros(data.BOARD_ROWS * data.BOARD_COLS, dtype=np.int8)
+        heights = [0] * data.BOARD_COLS
+        player = int(self.__rng.integers(1, 3))
+        previous = None
+        for _ in range(data.BOARD_ROWS * data.BOARD_COLS):
+            col = evaluator.choose_move(cells, heights, player, self.__rng, self.__exploration)
+            pos = (data.LAST_IDX_ROW - heights[col]) * data.BOARD_COLS + col
+            cells[pos] = player
+            heights[col] += 1
+            if evaluator.is_win(cells, pos):
+                if previous is not None:
+                    self._learn(previous, 1.0 if player == 1 else -1.0)
+                return player
+            if previous is not None:
+                self._learn(previous, evaluator.evaluate(cells))
+            previous = cells.copy()
+            player = 3 - player
+        # Board is full - tie.
+        self._learn(previous, 0.0)
+        return 0
+
+    def _learn(self, cells, target):
+        """
+        Private method that moves the value of given position towards target value.
+        :param cells: (array) of flat board positions.
+        :param target: (float) of target value for player 1.
+        """
+        error = target - self.__evaluator.evaluate(cells)
+        self.__evaluator.update(cells, self.__learning_rate * error)
+
+
+class NTupleAI:
+    """
+    This classes creates an AI player that chooses moves with an NTupleEvaluator, with the same interface as AI.
+    """
+
+    def __init__(self, game, player, evaluator, seed=None):
+        """
+        Init method for NTupleAI objects.
+        :param game: (Game) object with this game logic.
+        :param player: (int) in range (1-2) containing player number.
+        :param evaluator: (NTupleEvaluator) object with trained weights.
+        :param seed: (int) seed for breaking ties between equal moves. default=None: unseeded.
+        """
+        self.__game = game
+        self.__player = player
+        self.__evaluator = evaluator
+        self.__rng = np.random.default_rng(seed)
+        self.__last_found_move = None
+
+    def find_legal_move(self, timeout=None):
+        """
+        Returns the column with best evaluated position after the move.
+        :param timeout: not used - evaluation takes a few table lookups per column.
+        :return: (int) of column to go to.
+        """
+        if self.__game.get_current_player() != self.__player:
+            raise Exception('Wrong Player.')
+        cells = NTupleEvaluator.cells_of(self.__game)
+        heights = [int(np.count_nonzero(cells[col::data.BOARD_COLS])) for col in range(data.BOARD_COLS)]
+        if min(heights) == data.BOARD_ROWS:
+            raise Exception('No possible AI moves.')
+        self.__last_found_move = self.__evaluator.choose_move(cells, heights, self.__player, self.__rng)
+        return self.__last_found_move
+
+    def get_last_found_move(self):
+        return self.__last_found_move
@@ -0,0 +1,132 @@
+from ..data import game_data as data
+from .game import Game
+from multiprocessing import Pool
+import time
+
+
+class Perft:
+    """
+    This classes counts all positions reachable to a given depth from a start position, and the finished games
+    (wins of each player and ties) on the way, using only Game's public move API. The counts check a Game
+    implementation's correctness against reference counts, and the timing measures its throughput.
+    """
+
+    def __init__(self, moves=(), first_player=1):
+        """
+        Init method for Perft objects: Assigns start position.
+        :param moves: (list) of (int) of columns played from an empty board to reach start position.
+        :param first_player: (int) in range (1-2) of player who made the first move.
+        """
+        self.__moves = list(moves)
+        self.__first_player = first_player
+
+    def run(self, depth, workers=1):
+        """
+        Counts positions to given depth, optionally splitting root moves between parallel worker processes.
+        :param depth: (int) of number of moves to play from start position.
+        :param workers: (int) of worker processes. default=1: count in this process.
+        :return: (dict) containing leaves (positions after exactly depth moves, finished games included), nodes
+        (all positions visited), wins per player, ties, seconds and nodes per second.
+        """
+        start = time.perf_counter()
+        if workers > 1 and depth > 1:
+            game = self._start_game()
+            # Each root move is counted in a worker, from the start position plus that move.
+            tasks = [(self.__moves, self.__first_player, col, depth) for col in range(data.BOARD_COLS)
+                     if game.get_player_at(0, col) == data.INITIAL_VAL]
+            with Pool(workers) as pool:
+                results = pool.map(_count_subtree, tasks)
+            counts = Perft._new_counts()
+            # The root position itself is visited here.
+            counts['nodes'] += 1
+            for result in results:
+                Perft._merge(counts, result)
+        else:
+            counts = Perft._new_counts()
+            self._count(self._start_game(), depth, counts)
+        counts['seconds'] = time.perf_counter() - start
+        counts['nps'] = counts['nodes'] / counts['seconds'] if counts['seconds'] else 0
+        return counts
+
+    def _start_game(self):
+        """
+        Private method that creates Game object of start position.
+        :return: (Game) object.
+        """
+        game = Game(self.__first_player)
+        for col in self.__moves:
+            game.make_move(col)
+            if game.get_winner() is not None:
+                raise Exception('Start position is a finished game.')
+            game.add_turn()
+        return game
+
+    def _count(self, game, depth, counts):
+        """
+        Private recursive method that counts positions below given game position, playing and taking back moves.
+        :param game: (Game) object of position (restored to same position when done).
+        :param depth: (int) of remaining moves to play.
+        :param counts: (dict) of counts to add to.
+        """
+        counts['nodes'] += 1
+        # Recursion base: depth reached.
+        if depth == 0:
+            counts['leaves'] += 1
+            return
+        # Recursion step: counts positions below each legal column.
+        for col in range(data.BOARD_COLS):
+            if game.get_player_at(0, col) == data.INITIAL_VAL:
+                self._count_move(game, col, depth, counts)
+
+    def _count_move(self, game, col, depth, counts):
+        """
+        Private method for _count(). Plays given column, counts positions below it, and takes it back.
+        A move that finishes the game is counted as a win or tie, and not played further.
+        :param game: (Game) object of position (restored to same position when done).
+        :param col: (int) of legal column to play.
+        :param depth: (int) of remaining moves to play, including this move.
+        :param counts: (dict) of counts to add to.
+        """
+        game.make_move(col)
+        winner = game.get_winner()
+        game.add_turn()
+        if winner is None:
+            self._count(game, depth - 1, counts)
+        else:
+            counts['nodes'] += 1
+            if depth == 1:
+                counts['leaves'] += 1
+            if winner:
+                counts['wins'][winner] += 1
+            else:
+                counts['ties'] += 1
+        game.undo_move()
+
+    @staticmethod
+    def _new_counts():
+        return {'leaves': 0, 'nodes': 0, 'wins': {1: 0, 2: 0}, 'ties': 0}
+
+    @staticmethod
+    def _merge(counts, result):
+        """
+        Private method that adds worker result counts to counts.
+        :param counts: (dict) of counts to add to.
+        :param result: (dict) of worker counts.
+        """
+        for key in ('leaves', 'nodes', 'ties'):
+            counts[key] += result[key]
+        for player in counts['wins']:
+            counts['wins'][player] += result['wins'][player]
+
+
+def _count_subtree(task):
+    """
+    Private function for worker processes - counts positions below a root move of start position.
+    :param task: (tuple) of (list) of start moves, (int) of first player, (int) of root column and (int) of depth.
+    :return: (dict) of counts.
+    """
+    moves, first_player, col, depth = task
+    perft = Perft(moves, first_player)
+    counts = Perft._new_counts()
+    perft._count_move(perft._start_game(), col, depth, counts)
+    return counts
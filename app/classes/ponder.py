@@ -0,0 +1,78 @@
+from ..data import game_data as data
+import threading
+
+
+class Ponder:
+    """
+    This classes lets an AI player think during the human player's turn: A worker thread tries each likely human
+    move on a copy of the game and finds the AI reply to it. If the human plays one of them, the reply is ready.
+    """
+
+    def __init__(self, create_ai):
+        """
+        Init method for Ponder objects: Assigns AI factory, results dictionary and worker state.
+        :param create_ai: (function) that gets a (Game) object and returns AI object for it (with find_legal_move()).
+        """
+        self.__create_ai = create_ai
+        # Replies found so far, keyed by human's column.
+        self.__replies = {}
+        self.__lock = threading.Lock()
+        # Generation number of current pondering - results of older (discarded) workers are ignored.
+        self.__generation = 0
+        self.__cancel = threading.Event()
+
+    def start(self, game):
+        """
+        Starts pondering on given game, where the human player is to move. Discards previous pondering.
+        Must be called from the main thread, as the game is copied here.
+        :param game: (Game) object of current game.
+        """
+        self.stop()
+        self.__cancel = threading.Event()
+        worker = threading.Thread(target=self._ponder, args=(game.copy(), self.__generation, self.__cancel),
+                                  daemon=True)
+        worker.start()
+
+    def stop(self):
+        """
+        Stops current pondering (the worker stops after the reply it is finding) and discards its results.
+        """
+        self.__cancel.set()
+        with self.__lock:
+            self.__generation += 1
+            self.__replies = {}
+
+    def get_reply(self, col):
+        """
+        Returns the AI reply found for human move to given column, if it was found already.
+        :param col: (int) of column the human moved to.
+        :return: (int) of AI reply column, or None if reply wasn't found (yet).
+        """
+        with self.__lock:
+            return self.__replies.get(col)
+
+    def _ponder(self, game, generation, cancel):
+        """
+        Private method for the worker thread: Finds AI reply to each legal human move, center columns first
+        (the most likely human moves), until cancelled.
+        :param game: (Game) object copy of current game, human player to move.
+        :param generation: (int) of pondering generation of this worker.
+        :param cancel: (Event) object set when this pondering is discarded.
+        """
+        for col in sorted(range(data.BOARD_COLS), key=lambda c: abs(2 * c - data.LAST_IDX_COL)):
+            if cancel.is_set():
+                return
+            human_move = game.copy()
+            try:
+                human_move.make_move(col)
+            except Exception:
+                continue
+            # If human move ends the game, AI has no reply.
+            if human_move.get_winner() is not None:
+                continue
+            human_move.add_turn()
+            reply = self.__create_ai(human_move).find_legal_move()
+            with self.__lock:
+                if generation != self.__generation:
+                    return
+                self.__replies[col] = reply
@@ -1,7 +1,11 @@
 from ..data import game_data as data
 import tkinter as tk
+import time
 from .game import Game
 from .ai import AI
+from .ponder import Ponder
+from .board_canvas import BoardCanvas
+from .match_stats import MatchStats
 from .static.style import Style
 
 
@@ -10,15 +14,28 @@ class Screen:
     This classes creates the base screen, a blank full screen.
     """
 
-    def __init__(self):
+    def __init__(self, full_screen=True, run=True):
         """
         Init method for Screen. Starts tkinter widget (a blank full screen) and creates ScreenMenu instance.
+        :param full_screen: (boolean) False to keep a normal window, e.g. for performance harness. default=True.
+        :param run: (boolean) False to return without running Tkinter main loop, so caller drives the screens.
+        default=True.
         """
         self.__root = tk.Tk()
-        self._blank_full_screen()
+        if full_screen:
+            self._blank_full_screen()
+        else:
+            self.__root.configure(bg=Style.COLOR['BG_DEFAULT'])
         self._game_title()
-        ScreenMenu(self.__root)
-        self.__root.mainloop()
+        self.__menu = ScreenMenu(self.__root)
+        if run:
+            self.__root.mainloop()
+
+    def get_root(self):
+        return self.__root
+
+    def get_menu(self):
+        return self.__menu
 
     def _blank_full_screen(self):
         """
@@ -137,12 +154,23 @@ class ScreenMenu:
         # Change the picture of the avatar.
         Style.configure_image_label(label, self._avatar_image(player))
 
+    def start_game(self, player1=1, player2=1):
+        """
+        Starts game with given player types, as if chosen in menu and START was clicked (for scripted play).
+        :param player1: (int) in range (1-0) regarding player 1 type - 1: human, 0: AI.
+        :param player2: (int) in range (1-0) regarding player 2 type - 1: human, 0: AI.
+        :return: (ScreenGame) object.
+        """
+        self.__player = {1: player1, 2: player2}
+        return self._go_to_game()
+
     def _go_to_game(self):
         """
         Private method that destroys this screen main frame and creates new ScreenGame instance.
+        :return: (ScreenGame) object.
         """
         self.__frame.destroy()
-        ScreenGame(self.__root, self.__player[1], self.__player[2])
+        return ScreenGame(self.__root, self.__player[1], self.__player[2])
 
 
 class ScreenGame:
@@ -174,6 +202,15 @@ class ScreenGame:
         self.__ai = {
             1: AI(self.__game, 1) if not self.__player[1] else 0,
             2: AI(self.__game, 2) if not self.__player[2] else 0}
+        # If one player is human and the other is AI, the AI thinks of its replies during the human's turn.
+        ai_players = [player for player in self.__player if not self.__player[player]]
+        self.__ponder = Ponder(lambda game, p=ai_players[0]: AI(game, p)) if len(ai_players) == 1 else None
+        # True while an AI move is scheduled and not made yet, so AI move checks don't schedule another.
+        self.__ai_pending = False
+        # Time each AI move took, as (ply, player, ms) - recorded in match statistics when game ends.
+        self.__ai_latencies = []
+        # Win screen created when game is over.
+        self.__win_screen = None
         # Main game frame
         self.__frame = tk.Frame(self.__root, bg=Style.COLOR['BG_DEFAULT'])
         self.__frame.pack()
@@ -182,7 +219,7 @@ class ScreenGame:
         # Calls private method to create actual game frames widgets.
         self._create_board()
         # Keyboard shortcut - backspace to return to main menu
-        self.__frame.bind('<BackSpace>', lambda event: _go_to_menu(self.__frame, self.__root))
+        self.__frame.bind('<BackSpace>', lambda event: self._go_to_menu())
 
     def _create_board(self):
         """
@@ -198,11 +235,14 @@ class ScreenGame:
         board_frame = tk.Frame(self.__frame, bg=Style.COLOR['BOARD'], bd=Style.BORDER['S'], relief='ridge')
         board_frame.grid(row=2, column=2)
         # Using private method, creates in ctrl frame grid of buttons that moves disc to column.
-        self._create_col_buttons(ctrl_frame, board_frame)
-        # Using private method, creates in board frame grid of rows and columns of the game board.
-        self._create_board_gfx(board_frame)
+        self._create_col_buttons(ctrl_frame)
+        # Creates in board frame a canvas that draws the game board.
+        self.__board_canvas = BoardCanvas(board_frame, self.__board)
+        self.__board_canvas.get_canvas().pack()
         # Calls AI move method - operates only when AI player turn.
         self._ai_move(board_frame)
+        # Starts AI pondering if human player starts.
+        self._start_ponder()
 
     def _create_player_frame(self, player, col):
         """
@@ -247,11 +287,10 @@ class ScreenGame:
         # Re-calls this same method over and over, to continually changing player's status.
         self.__frame.after(100, self._signal_player_turn, avatar_img, player_title, stats_title, player)
 
-    def _create_col_buttons(self, ctrl_frame, board_frame):
+    def _create_col_buttons(self, ctrl_frame):
         """
         Private method that creates in ctrl frame grid of buttons that moves disc to column.
         :param ctrl_frame: Tkinter (Frame) object to create the col buttons in.
-        :param board_frame: Tkinter (Frame) to change if col button is clicked.
         """
         # Goes over all the columns of the game board, and:
         for col in range(len(self.__board[0])):
@@ -259,7 +298,7 @@ class ScreenGame:
             col_button = Style.create_image_label(ctrl_frame, Style.IMG_PLAYER['CLICK']['NONE'])
             col_button.grid(row=0, column=col)
             # Binds action to left mouse clicker: call _col_click() method that moves disc to column.
-            col_button.bind('<Button-1>', lambda event, b_f=board_frame, c=col: self._col_click(b_f, c))
+            col_button.bind('<Button-1>', lambda event, c=col: self._col_click(c))
             # Binds action to mouse hover (in and out): call _enter_col()/_leave_col() method that changes col icon.
             col_button.bind('<Enter>', lambda event, c_b=col_button: self._enter_col(c_b))
             col_button.bind('<Leave>', lambda event, c_b=col_button: self._leave_col(c_b))
@@ -287,20 +326,6 @@ class ScreenGame:
         # Upon mouse leave, changes col button image to initial icon.
         Style.configure_image_label(col_button, Style.IMG_PLAYER['CLICK']['NONE'])
 
-    def _create_board_gfx(self, frame):
-        """
-        Private method that creates in board frame a grid of rows and columns of the Game board.
-        :param frame: Tkinter (Frame) object to assign the grid to.
-        """
-        # Goes over all the board list (2d list of rows and cols), and:
-        for row in range(len(self.__board)):
-            for col in range(len(self.__board[row])):
-                # Checks which val in each col (1, 2, initial val or winner val).
-                pos_val = self.__board[row][col]
-                # Creates image label for the appropriate val found, and assigns it to grid in same row and col.
-                cell = Style.create_image_label(frame, Style.IMAGES['CELL'][pos_val])
-                cell.grid(row=row, column=col)
-
     def _ai_move(self, board_frame):
         """
         Recurring method that operates only when AI player turn.
@@ -309,49 +334,122 @@ class ScreenGame:
         """
         if self.__winner is not None:
             return
-        # Checks if the current player is an AI player, and if so:
-        if self.__ai[self.__game.get_current_player()]:
+        # Checks if the current player is an AI player (whose move was not scheduled yet), and if so:
+        if self.__ai[self.__game.get_current_player()] and not self.__ai_pending:
             # Calls find_legal_move() method from AI classes, that returns optimal column for player to go to.
+            start = time.perf_counter()
             col = self.__ai[self.__game.get_current_player()].find_legal_move()
             # Delays action by 1 second for a natural feel for the game, and calls method that moves to specified col.
-            board_frame.after(data.BASE_SPEED, self._move_to_col, board_frame, col)
+            self._schedule_ai_move(col, start, data.BASE_SPEED)
         # Re-calls this same method each 1 second: It will check if current player is an AI player,
         # if not, will call method again and if so do the same actions described above.
         board_frame.after(data.BASE_SPEED, self._ai_move, board_frame)
 
-    def _col_click(self, board_frame, col):
+    def _col_click(self, col):
         """
         Private method that moves disc to column, if human clicked a col button.
-        :param board_frame: Tkinter (Frame) object to modify game board if necessary.
         :param col: (int) representing col to go to.
         :return: None if current player turn is AI or winner was found.
         """
         if not self.__player[self.__game.get_current_player()] or self.__winner is not None:
             return
         # Calls method that moves to specified col.
-        self._move_to_col(board_frame, col)
+        self._move_to_col(col)
 
-    def _move_to_col(self, board_frame, col):
+    def _move_to_col(self, col):
         """
         Private method that moves to specified col, either by AI or by human players.
-        :param board_frame: Tkinter (Frame) object to modify game board if possible.
         :param col: (int) representing col to go to.
         :return: None if (1) col was not vacant. (2) winner was found.
         """
+        # Scheduled AI move (if any) is being made now.
+        self.__ai_pending = False
         # Tries to make the specified move, if failed returns.
         try:
             self.__game.make_move(col)
         except:
             return
+        # Takes AI reply to this move found while pondering (if any), before pondering is discarded.
+        reply_start = time.perf_counter()
+        reply = self.__ponder.get_reply(col) if self.__ponder else None
         # Calls get_winner() method from Game classes and assign it to winner var:
         self.__winner = self.__game.get_winner()
-        # Recreates the board with updated icons.
-        self._create_board_gfx(board_frame)
-        # If winner var is not None, game is over and pops up winner frame after 1 second.
+        # If winner var is not None, game is over - winner frame pops up after the disc landed.
         if self.__winner is not None:
-            self.__frame.after(data.BASE_SPEED, self._create_winner_frame)
+            self._record_stats()
+        # Drops the disc into its position on board canvas, and redraws board with updated icons.
+        self.__board_canvas.drop(self.__board, *self.__game.get_last_move(), self.__game.get_current_player(),
+                                 self._last_disc_landed if self.__winner is not None else None)
         # Adds 1 turn to game.
         self.__game.add_turn()
+        # Plays AI reply found while pondering once this disc has landed, without waiting for next AI move check.
+        if reply is not None and self.__winner is None and self.__ai[self.__game.get_current_player()]:
+            self._schedule_ai_move(reply, reply_start, data.DROP_TIME)
+        # Discards pondering on this move, and starts pondering on next move if it is human's.
+        self._start_ponder()
+
+    def _schedule_ai_move(self, col, start, delay):
+        """
+        Private method that records time current AI player took to choose its move, and schedules the move.
+        :param col: (int) representing col AI player goes to.
+        :param start: (float) of perf_counter() time AI player started choosing its move.
+        :param delay: (int) of ms to wait before moving, for a natural feel for the game.
+        """
+        self.__ai_latencies.append((len(self.__game.get_move_history()), self.__game.get_current_player(),
+                                    (time.perf_counter() - start) * 1000))
+        self.__ai_pending = True
+        self.__frame.after(delay, self._move_to_col, col)
+
+    def _last_disc_landed(self):
+        """
+        Private method called when game's last disc landed - pops up winner frame after 1 second.
+        """
+        self.__frame.after(data.BASE_SPEED, self._create_winner_frame)
+
+    def _record_stats(self):
+        """
+        Private method that queues this finished game in match statistics store (written in background).
+        """
+        player_types = {player: 'human' if self.__player[player] else 'AI' for player in self.__player}
+        MatchStats.shared().record_game(player_types, self.__game.get_first_player(), self.__winner,
+                                        len(self.__game.get_move_history()), self.__ai_latencies)
+
+    def get_board_canvas(self):
+        return self.__board_canvas
+
+    def get_game(self):
+        return self.__game
+
+    def get_winner(self):
+        return self.__winner
+
+    def get_win_screen(self):
+        return self.__win_screen
+
+    def click_col(self, col):
+        """
+        Moves current human player to given column, as if its col button was clicked (for scripted play).
+        :param col: (int) representing col to go to.
+        """
+        self._col_click(col)
+
+    def _start_ponder(self):
+        """
+        Private method that stops current AI pondering, and starts pondering if game is on and human player turn.
+        """
+        if not self.__ponder:
+            return
+        self.__ponder.stop()
+        if self.__winner is None and self.__player[self.__game.get_current_player()]:
+            self.__ponder.start(self.__game)
+
+    def _go_to_menu(self):
+        """
+        Private method that stops AI pondering and goes back to main menu.
+        """
+        if self.__ponder:
+            self.__ponder.stop()
+        _go_to_menu(self.__frame, self.__root)
 
     def _create_winner_frame(self):
         """
@@ -376,9 +474,12 @@ class ScreenGame:
         """
         Private method that destroys this screen main frame and creates new ScreenWin instance.
         """
+        if self.__ponder:
+            self.__ponder.stop()
         banner_frame.destroy()
         self.__frame.destroy()
-        ScreenWin(self.__root, self.__winner, self.__player[1], self.__player[2], self.__stats[1], self.__stats[2])
+        self.__win_screen = ScreenWin(self.__root, self.__winner, self.__player[1], self.__player[2],
+                                      self.__stats[1], self.__stats[2])
 
 
 class ScreenWin:
@@ -433,13 +534,21 @@ class ScreenWin:
         Style.create_image_label(self.__frame, Style.IMG_PLAYER['WIN'][self.__winner][player_type],
                                  Style.BORDER['L']).pack()
 
+    def play_again(self):
+        """
+        Plays again with the same settings and statistics, as if PLAY AGAIN was clicked (for scripted play).
+        :return: (ScreenGame) object.
+        """
+        return self._go_to_game_again()
+
     def _go_to_game_again(self):
         """
         Private method that destroys this screen main frame and creates new ScreenGame instance,
         with the same settings and statistics.
+        :return: (ScreenGame) object.
         """
         self.__frame.destroy()
-        ScreenGame(self.__root, self.__player[1], self.__player[2], self.__stats[1], self.__stats[2])
+        return ScreenGame(self.__root, self.__player[1], self.__player[2], self.__stats[1], self.__stats[2])
 
 
 def _go_to_menu(frame, root):
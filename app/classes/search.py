@@ -0,0 +1,320 @@
+from ..data import game_data as data
+from .board import Board
+from .eval_state import EvalState
+import time
+
+
+class MoveOrder:
+    """
+    This classes orders the columns tried in each search node, so the best move is usually tried first and
+    alpha-beta prunes more: Hash move from the transposition table, killer moves per ply, history heuristic
+    and static center-first order. Each heuristic can be turned off, to measure its gain in searched nodes.
+    """
+
+    # Number of killer moves remembered for each ply.
+    KILLER_SLOTS = 2
+
+    def __init__(self, hash_move=True, killers=True, history=True):
+        """
+        Init method for MoveOrder objects: Assigns enabled heuristics, static order, killers and history tables.
+        :param hash_move: (boolean) True to try best move stored in transposition table first.
+        :param killers: (boolean) True to try moves that caused cutoffs in same ply (in sibling nodes) early.
+        :param history: (boolean) True to order moves by how many cutoffs they caused anywhere in search.
+        """
+        self.__use_hash_move = hash_move
+        self.__use_killers = killers
+        self.__use_history = history
+        # Static order - center columns first, as they take part in most combinations.
+        self.__static_order = sorted(range(data.BOARD_COLS), key=lambda col: abs(2 * col - data.LAST_IDX_COL))
+        self.__killers = {}
+        self.__history = {1: [0] * data.BOARD_COLS, 2: [0] * data.BOARD_COLS}
+
+    def order(self, board, ply, hash_move=None):
+        """
+        Returns legal columns of given board in the order they should be searched.
+        :param board: (Board) object of searched position.
+        :param ply: (int) of distance of this node from search root.
+        :param hash_move: (int) of best column stored for this position in transposition table, or None.
+        :return: (list) of (int) containing ordered legal columns.
+        """
+        cols = [col for col in self.__static_order if board.can_play(col)]
+        if self.__use_history:
+            # Stable sort - columns with equal history keep static order.
+            history = self.__history[board.get_current_player()]
+            cols.sort(key=lambda col: -history[col])
+        first = []
+        if self.__use_hash_move and hash_move is not None and hash_move in cols:
+            first.append(hash_move)
+        if self.__use_killers:
+            for killer in self.__killers.get(ply, ()):
+                if killer in cols and killer not in first:
+                    first.append(killer)
+        if not first:
+            return cols
+        return first + [col for col in cols if col not in first]
+
+    def record_cutoff(self, player, col, ply, depth):
+        """
+        Records move that caused a beta cutoff, for killers and history heuristics.
+        :param player: (int) in range (1-2) of player that made the move.
+        :param col: (int) of column of the move.
+        :param ply: (int) of distance of the node from search root.
+        :param depth: (int) of remaining search depth at the node (deeper cutoffs weigh more).
+        """
+        killers = self.__killers.setdefault(ply, [])
+        if col in killers:
+            killers.remove(col)
+        killers.insert(0, col)
+        del killers[MoveOrder.KILLER_SLOTS:]
+        self.__history[player][col] += depth * depth
+
+    def clear(self):
+        """
+        Resets killers and history tables (e.g. before searching an unrelated position).
+        """
+        self.__killers = {}
+        self.__history = {1: [0] * data.BOARD_COLS, 2: [0] * data.BOARD_COLS}
+
+
+class Search:
+    """
+    This classes searches the game tree to a given depth with negamax alpha-beta and iterative deepening, using a
+    transposition table and pluggable move ordering. It counts searched nodes and cutoffs for performance statistics.
+    The transposition table has a fixed number of entries (indexed by position key hash): A new entry replaces the
+    entry in its slot if that entry is from an earlier search or was searched to the same depth or less.
+    """
+
+    # Transposition table entry flags - stored score is exact, a lower bound or an upper bound.
+    EXACT, LOWER, UPPER = 0, 1, 2
+    # Number of nodes between checks of the time limit.
+    TIME_CHECK_NODES = 1024
+
+    def __init__(self, move_order=None, table_size=data.SEARCH_TABLE_SIZE):
+        """
+        Init method for Search objects: Assigns move ordering, transposition table, evaluation state and statistics.
+        :param move_order: (MoveOrder) object. default=None: all move ordering heuristics enabled.
+        :param table_size: (int) of number of transposition table entries.
+        """
+        if table_size < 1:
+            raise Exception('Table size must be positive.')
+        self.__move_order = move_order if move_order is not None else MoveOrder()
+        # Table slots of (key, depth, score, flag, best column, search number) entries, or None.
+        self.__table = [None] * table_size
+        # Number of current search, so entries of earlier searches (earlier moves) are replaced first.
+        self.__age = 0
+        # Line counts of searched position, updated on each move in search - leaf evaluation is a lookup.
+        self.__state = None
+        self.__deadline = None
+        self.__stats = {}
+        self.reset_stats()
+
+    def search(self, board, depth, timeout=None, time_manager=None):
+        """
+        Searches given board with iterative deepening, up to given depth or until timeout.
+        :param board: (Board) object of position to search (restored to same position when done).
+        :param depth: (int) of max search depth in moves.
+        :param timeout: (float) of seconds to search. default=None: no time limit.
+        :param time_manager: (TimeManager) object, with move started, that sets the time limit after each iteration
+        (instead of timeout). default=None.
+        :return: (tuple) of (int) column of best move found and (int) its score for current player.
+        """
+        start = time.perf_counter()
+        self.__age += 1
+        if time_manager is not None:
+            timeout = time_manager.get_allocated()
+        self.__deadline = start + timeout if timeout is not None else None
+        # The best move of the last completed iteration (initially first ordered column).
+        best = (self.__move_order.order(board, 0)[0], 0)
+        moves_count = board.get_moves_count()
+        self.__state = Search._create_eval_state(board)
+        try:
+            for iteration_depth in range(1, depth + 1):
+                best = self._root(board, iteration_depth)
+                # Stops if a forced win or loss was found - deeper search won't change it.
+                if abs(best[1]) >= data.SEARCH_WIN_SCORE - data.BOARD_ROWS * data.BOARD_COLS:
+                    break
+                # Time manager extends time if best move changed, or stops if next iteration can't finish in time.
+                if time_manager is not None:
+                    timeout = time_manager.update(best[0], iteration_depth, time.perf_counter() - start)
+                    if timeout is None:
+                        break
+                    self.__deadline = start + timeout
+        except _SearchTimeout:
+            # Takes back moves of the interrupted iteration.
+            while board.get_moves_count() > moves_count:
+                col = board.undo()
+                self.__state.remove(data.LAST_IDX_ROW - board.get_height(col), col, board.get_current_player())
+        self.__stats['time'] += time.perf_counter() - start
+        return best
+
+    def get_stats(self):
+        """
+        Returns search statistics, summed over all searches since last reset_stats().
+        :return: (dict) containing nodes, time, nodes per second, cutoffs and cutoff rate (of interior nodes),
+        first move cutoff rate (of cutoffs) and transposition table hits.
+        """
+        stats = dict(self.__stats)
+        stats['nps'] = stats['nodes'] / stats['time'] if stats['time'] else 0
+        stats['cutoff_rate'] = stats['cutoffs'] / stats['interior_nodes'] if stats['interior_nodes'] else 0
+        stats['first_cutoff_rate'] = stats['first_cutoffs'] / stats['cutoffs'] if stats['cutoffs'] else 0
+        return stats
+
+    def reset_stats(self):
+        self.__stats = {'nodes': 0, 'interior_nodes': 0, 'cutoffs': 0, 'first_cutoffs': 0, 'tt_hits': 0,
+                        'time': 0.0}
+
+    def clear(self):
+        """
+        Resets transposition table and move ordering tables.
+        """
+        self.__table = [None] * len(self.__table)
+        self.__age = 0
+        self.__move_order.clear()
+
+    def _root(self, board, depth):
+        """
+        Private method for search(). Searches all root moves to given depth. On a symmetric board, skips the
+        mirrored duplicates of the left columns.
+        :param board: (Board) object of root position.
+        :param depth: (int) of search depth.
+        :return: (tuple) of (int) column of best move and (int) its score.
+        """
+        entry = self._probe(board.get_key())
+        cols = self.__move_order.order(board, 0, entry[4] if entry else None)
+        if board.is_symmetric():
+            cols = [col for col in cols if col <= data.LAST_IDX_COL // 2]
+        best_col, alpha = cols[0], -data.SEARCH_WIN_SCORE - 1
+        for col in cols:
+            score = self._move_score(board, col, depth, alpha, data.SEARCH_WIN_SCORE + 1, 0)
+            if score > alpha:
+                best_col, alpha = col, score
+        self._store(board.get_key(), depth, alpha, Search.EXACT, best_col)
+        return best_col, alpha
+
+    def _move_score(self, board, col, depth, alpha, beta, ply):
+        """
+        Private method that plays given column, scores it with negamax for the player who moved, and takes it back.
+        :param board: (Board) object of position.
+        :param col: (int) of legal column to play.
+        :param depth: (int) of remaining search depth, including this move.
+        :param alpha: (int) of lower bound of score for the player who moves.
+        :param beta: (int) of upper bound of score for the player who moves.
+        :param ply: (int) of distance of position from search root.
+        :return: (int) of move score for the player who moves.
+        """
+        row, player = data.LAST_IDX_ROW - board.get_height(col), board.get_current_player()
+        board.play(col)
+        self.__state.add(row, col, player)
+        if board.last_move_won():
+            score = data.SEARCH_WIN_SCORE - (ply + 1)
+        else:
+            score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+        board.undo()
+        self.__state.remove(row, col, player)
+        return score
+
+    def _negamax(self, board, depth, alpha, beta, ply):
+        """
+        Private recursive method that scores a position for its current player with alpha-beta pruning.
+        :param board: (Board) object of position.
+        :param depth: (int) of remaining search depth.
+        :param alpha: (int) of lower bound of score the current player is already guaranteed.
+        :param beta: (int) of upper bound of score the other player is already guaranteed.
+        :param ply: (int) of distance from search root.
+        :return: (int) of position score for current player.
+        """
+        self.__stats['nodes'] += 1
+        if self.__deadline is not None and self.__stats['nodes'] % Search.TIME_CHECK_NODES == 0 and \
+                time.perf_counter() > self.__deadline:
+            raise _SearchTimeout()
+        # Recursion base: board is full (tie) or search depth reached.
+        if board.is_full():
+            return 0
+        if depth == 0:
+            return self.__state.get_score(board.get_current_player())
+        self.__stats['interior_nodes'] += 1
+        key = board.get_key()
+        entry = self._probe(key)
+        hash_move = None
+        if entry is not None:
+            _, entry_depth, entry_score, entry_flag, hash_move, _ = entry
+            if entry_depth >= depth:
+                self.__stats['tt_hits'] += 1
+                if entry_flag == Search.EXACT:
+                    return entry_score
+                if entry_flag == Search.LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+        alpha_origin = alpha
+        best_score, best_col = -data.SEARCH_WIN_SCORE - 1, None
+        # Recursion step: scores each move in order, until one is too good for the other player to allow.
+        for idx, col in enumerate(self.__move_order.order(board, ply, hash_move)):
+            score = self._move_score(board, col, depth, alpha, beta, ply)
+            if score > best_score:
+                best_score, best_col = score, col
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.__stats['cutoffs'] += 1
+                if idx == 0:
+                    self.__stats['first_cutoffs'] += 1
+                self.__move_order.record_cutoff(board.get_current_player(), col, ply, depth)
+                break
+        if best_score <= alpha_origin:
+            flag = Search.UPPER
+        elif best_score >= beta:
+            flag = Search.LOWER
+        else:
+            flag = Search.EXACT
+        self._store(key, depth, best_score, flag, best_col)
+        return best_score
+
+    def _probe(self, key):
+        """
+        Private method that finds transposition table entry of given position.
+        :param key: (tuple) of position key (see Board.get_key()).
+        :return: (tuple) of entry (key, depth, score, flag, best column, search number), or None if not stored.
+        """
+        entry = self.__table[hash(key) % len(self.__table)]
+        return entry if entry is not None and entry[0] == key else None
+
+    def _store(self, key, depth, score, flag, best_col):
+        """
+        Private method that stores search result of given position in its transposition table slot, unless the slot
+        holds a deeper search result of current search.
+        :param key: (tuple) of position key (see Board.get_key()).
+        :param depth: (int) of search depth of result.
+        :param score: (int) of position score for current player.
+        :param flag: (int) of score type - EXACT, LOWER or UPPER bound.
+        :param best_col: (int) of best column found, or None.
+        """
+        idx = hash(key) % len(self.__table)
+        entry = self.__table[idx]
+        if entry is None or entry[5] != self.__age or entry[1] <= depth or entry[0] == key:
+            self.__table[idx] = (key, depth, score, flag, best_col, self.__age)
+
+    @staticmethod
+    def _create_eval_state(board):
+        """
+        Private method that creates evaluation state of given board: Leaf score of a position is its current player's
+        open lines score (see SEARCH_LINE_WEIGHTS) minus the other player's.
+        :param board: (Board) object of position.
+        :return: (EvalState) object with all board discs.
+        """
+        state = EvalState()
+        for col in range(data.BOARD_COLS):
+            for height in range(board.get_height(col)):
+                row = data.LAST_IDX_ROW - height
+                player = 1 if board.get_mask(1) & Board.bit(row, col) else 2
+                state.add(row, col, player)
+        return state
+
+
+class _SearchTimeout(Exception):
+    """
+    Private exception raised inside search when time limit is over.
+    """
+    pass
@@ -0,0 +1,38 @@
+import hashlib
+import random
+
+
+class SeedStream:
+    """
+    This classes derives independent seeds for parallel workers, games and AI players from a single base seed,
+    so a whole benchmark or simulation run can be replayed exactly from its base seed.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Init method for SeedStream objects: Assigns base seed.
+        :param seed: (int) base seed of this run. default=None: random base seed (see get_seed() to replay it).
+        """
+        self.__seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+
+    def get_seed(self):
+        return self.__seed
+
+    def seed_for(self, *path):
+        """
+        Returns seed derived from base seed and given path. The same path always gives the same seed,
+        and different paths give independent seeds (e.g. seed_for(worker) / seed_for(worker, game, player)).
+        :param path: (int) or (str) items identifying the seed consumer.
+        :return: (int) of 63 bit seed.
+        """
+        text = ':'.join(str(item) for item in (self.__seed,) + path)
+        digest = hashlib.sha256(text.encode()).digest()
+        return int.from_bytes(digest[:8], 'big') >> 1
+
+    def spawn(self, count):
+        """
+        Returns child streams for given number of parallel workers - each with its own independent base seed.
+        :param count: (int) of number of workers.
+        :return: (list) of (SeedStream) objects.
+        """
+        return [SeedStream(self.seed_for('worker', worker)) for worker in range(count)]
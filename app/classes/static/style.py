@@ -1,5 +1,6 @@
 from app.data import game_data as data
 import tkinter as tk
+import os
 
 
 class Style:
@@ -10,7 +11,7 @@ class Style:
         'BG_DEFAULT': 'black', 'BOARD': '#550000', 'TXT_DEFAULT': 'white', 'NOTICE': '#FF00AA', 'MESSAGE': '#00FF00',
         'PLAYER': {1: '#FF0000', 2: '#55FFFF'}
     }
-    IMG_DIR = r'assets\images\\'
+    IMG_DIR = os.path.join('assets', 'images', '')
     IMAGES = {
         'TITLE': IMG_DIR + 'title.png',
         'CELL': {1: IMG_DIR + 'cell_1.png', 2: IMG_DIR + 'cell_2.png', data.INITIAL_VAL: IMG_DIR + 'cell_none.png',
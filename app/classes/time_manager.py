@@ -0,0 +1,120 @@
+from ..data import game_data as data
+
+
+class TimeManager:
+    """
+    This classes manages an AI player's game clock (total time plus increment per move): It allocates time to each
+    move by game phase and position complexity, extends it when the best move changes between search iterations,
+    answers forced moves at once, and logs time spent versus time allocated per move.
+    """
+
+    def __init__(self, clock=data.TIME_CLOCK, increment=data.TIME_INCREMENT):
+        """
+        Init method for TimeManager objects: Assigns clock, increment, current move state and log.
+        :param clock: (float) of seconds on player's clock at game start.
+        :param increment: (float) of seconds added to clock after each move.
+        """
+        self.__remaining = clock
+        self.__increment = increment
+        # Current move's allocated time, max time (allowed for unstable searches) and search state.
+        self.__move = None
+        self.__log = []
+
+    def get_remaining(self):
+        return self.__remaining
+
+    def get_log(self):
+        """
+        Returns log of this player's moves.
+        :return: (list) of (dict) containing ply, allocated, max and spent seconds, forced (boolean), search depth
+        completed and number of best move changes between iterations.
+        """
+        return [dict(move) for move in self.__log]
+
+    def get_allocated(self):
+        return self.__move['allocated'] if self.__move is not None else None
+
+    def start_move(self, board):
+        """
+        Starts a move: Finds forced move (single legal column, immediate win or block of opponent's immediate win),
+        or allocates time to the move.
+        :param board: (Board) object of position, with this player to move.
+        :return: (int) of forced column, or None if move is not forced.
+        """
+        cols = board.legal_cols()
+        forced = TimeManager._forced_col(board, cols)
+        self.__move = {'ply': board.get_moves_count(), 'allocated': 0.0, 'max': 0.0, 'spent': None,
+                       'forced': forced is not None, 'depth': 0, 'changes': 0, 'best': None}
+        if forced is None:
+            self.__move['allocated'], self.__move['max'] = self._allocate(board, len(cols))
+        return forced
+
+    def update(self, col, depth, elapsed):
+        """
+        Called by search after each completed iteration: Extends allocated time (up to max) if best move changed,
+        and decides whether to start the next iteration.
+        :param col: (int) of best column found by this iteration.
+        :param depth: (int) of iteration depth.
+        :param elapsed: (float) of seconds since search started.
+        :return: (float) of seconds allowed since search started, or None to stop searching.
+        """
+        move = self.__move
+        if move['best'] is not None and col != move['best']:
+            move['changes'] += 1
+            move['allocated'] = min(move['allocated'] * data.TIME_EXTEND_FACTOR, move['max'])
+        move['best'] = col
+        move['depth'] = depth
+        # The next iteration takes several times longer than this one - don't start it if it can't finish.
+        if elapsed >= move['allocated'] * data.TIME_NEXT_ITERATION:
+            return None
+        return move['allocated']
+
+    def end_move(self, spent):
+        """
+        Ends a move: Takes spent time from clock, adds increment and logs the move.
+        :param spent: (float) of seconds spent on move.
+        """
+        self.__remaining = self.__remaining - spent + self.__increment
+        self.__move['spent'] = spent
+        del self.__move['best']
+        self.__log.append(self.__move)
+        self.__move = None
+
+    def _allocate(self, board, legal_count):
+        """
+        Private method that allocates time to a move: the clock split over the moves assumed left, plus increment,
+        less in the opening and more in complex positions (many legal columns).
+        :param board: (Board) object of position.
+        :param legal_count: (int) of number of legal columns.
+        :return: (tuple) of (float) allocated seconds and (float) max seconds.
+        """
+        usable = max(0.0, self.__remaining - data.TIME_SAFETY)
+        # This player makes about half the moves left on board.
+        moves_left = max(data.TIME_MIN_MOVES_LEFT, (data.BOARD_ROWS * data.BOARD_COLS - board.get_moves_count()) // 2)
+        allocated = usable / moves_left + self.__increment
+        if board.get_moves_count() < data.TIME_OPENING_MOVES:
+            allocated *= data.TIME_OPENING_FACTOR
+        # From half (one legal column) to 1.5 (all columns legal) of normal time.
+        allocated *= 0.5 + legal_count / data.BOARD_COLS
+        max_time = min(usable, usable * data.TIME_MAX_FRACTION + self.__increment)
+        return min(allocated, max_time), max_time
+
+    @staticmethod
+    def _forced_col(board, cols):
+        """
+        Private method that finds a forced column: the only legal one, an immediate win, or the block of the
+        opponent's immediate win.
+        :param board: (Board) object of position.
+        :param cols: (list) of (int) of legal columns.
+        :return: (int) of forced column, or None.
+        """
+        if len(cols) == 1:
+            return cols[0]
+        for col in cols:
+            if board.is_winning_move(col):
+                return col
+        opponent = 3 - board.get_current_player()
+        for col in cols:
+            if board.is_winning_move(col, opponent):
+                return col
+        return None
@@ -10,3 +10,62 @@ LAST_IDX_ROW = BOARD_ROWS - 1
 LAST_IDX_COL = BOARD_COLS - 1
 BASE_SPEED = 1000
 TRANSITION_SPEED = 3500
+# Evaluation cache limits - max cached positions and optional disk file to persist to (None: memory only)
+EVAL_CACHE_SIZE = 200000
+EVAL_CACHE_FILE = None
+# Search leaf evaluation - score of a line with 0-4 discs of one player and no discs of the other player
+SEARCH_LINE_WEIGHTS = (0, 1, 10, 100, 1000)
+# Search score of a win (minus number of moves to it, so faster wins are preferred)
+SEARCH_WIN_SCORE = 100000
+# Search transposition table - number of entries (fixed, so memory use doesn't grow over a game)
+SEARCH_TABLE_SIZE = 2 ** 17
+# Positions (column sequences from an empty board, player 1 first) for measuring search performance
+BENCHMARK_POSITIONS = (
+    (),
+    (3, 3, 3, 3),
+    (3, 2, 4, 4, 2, 3),
+    (3, 3, 2, 4, 4, 2, 1, 5),
+    (0, 6, 1, 5, 3, 3, 4, 2, 3),
+    (3, 4, 3, 4, 2, 2, 4, 3, 5, 1, 6),
+    (3, 3, 3, 3, 3, 2, 2, 2, 4, 4, 4, 4, 1, 5),
+)
+# Monte Carlo tree search - default playouts per move and UCT exploration constant
+MCTS_PLAYOUTS = 3000
+MCTS_EXPLORATION = 1.4
+# Board animation - frame budget (ms per frame, 60 fps) and time of disc drop from top to bottom row (ms)
+FRAME_TIME = 16
+DROP_TIME = 350
+# Perft reference counts from an empty board, player 1 first: depth - (leaves, player 1 wins, player 2 wins, ties)
+PERFT_COUNTS = {
+    1: (7, 0, 0, 0),
+    2: (49, 0, 0, 0),
+    3: (343, 0, 0, 0),
+    4: (2401, 0, 0, 0),
+    5: (16807, 0, 0, 0),
+    6: (117649, 0, 0, 0),
+    7: (823536, 13032, 0, 0),
+    8: (5673234, 13032, 44430, 0),
+    9: (39394572, 1099914, 44430, 0),
+}
+# N-tuple evaluator training - TD learning rate and chance of exploratory random move in self-play
+NTUPLE_LEARNING_RATE = 0.01
+NTUPLE_EXPLORATION = 0.1
+# Game analysis - archived games analysed between checkpoints, and score loss of a move counted as blunder
+ANALYSIS_CHUNK_SIZE = 1000
+ANALYSIS_BLUNDER_LOSS = 500
+# Match statistics store - SQLite file, max games written per transaction and seconds to wait for more games
+STATS_FILE = 'match_stats.db'
+STATS_BATCH_SIZE = 500
+STATS_FLUSH_TIME = 1.0
+# Time management - default clock and increment per player (seconds), moves assumed left at least, opening moves
+# and their share of normal time, max share of clock per move, extension of unstable searches, share of move time
+# after which no new search iteration is started, and safety margin (seconds) kept on clock
+TIME_CLOCK = 60.0
+TIME_INCREMENT = 1.0
+TIME_MIN_MOVES_LEFT = 8
+TIME_OPENING_MOVES = 4
+TIME_OPENING_FACTOR = 0.5
+TIME_MAX_FRACTION = 0.3
+TIME_EXTEND_FACTOR = 2.0
+TIME_NEXT_ITERATION = 0.4
+TIME_SAFETY = 0.05
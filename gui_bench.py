@@ -0,0 +1,27 @@
+from app.classes.gui_harness import GuiHarness
+import argparse
+import json
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plays scripted games in the GUI and records GUI cost per move.')
+    parser.add_argument('output', help='JSON file to write results to')
+    parser.add_argument('--games', type=int, default=5, help='number of scripted games')
+    parser.add_argument('--seed', type=int, default=0, help='seed for scripted games')
+    parser.add_argument('--real-delays', action='store_true', help='keep the game\'s delays between moves and screens')
+    args = parser.parse_args()
+    harness = GuiHarness(fast=not args.real_delays)
+    try:
+        results = harness.run(GuiHarness.scripted_games(args.games, args.seed))
+    finally:
+        harness.close()
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+    summary = results['summary']
+    print('{} games, {} moves, avg redraw {:.1f} ms, max redraw {:.1f} ms'.format(
+        summary['games'], summary['moves'], summary['avg_redraw_ms'], summary['max_redraw_ms']))
+    print('animation: {} frames, avg {:.1f} ms, max {:.1f} ms, {} over budget'.format(
+        summary['frames']['frames'], summary['frames']['avg_ms'], summary['frames']['max_ms'],
+        summary['frames']['over_budget']))
+    for key in ('widgets', 'images', 'after_callbacks', 'rss_kb'):
+        print('{:<16}{:>10} -> {}'.format(key, str(summary['start'][key]), summary['end'][key]))
@@ -0,0 +1,41 @@
+from app.classes.perft import Perft
+from app.data import game_data as data
+import argparse
+
+
+def run_perft(depth, moves, workers):
+    """
+    Runs perft to each depth up to given depth and prints counts, timing and reference check (for empty board).
+    :param depth: (int) of max depth.
+    :param moves: (list) of (int) of columns played to reach start position (player 1 first).
+    :param workers: (int) of worker processes to split root moves between.
+    :return: (boolean) True if all counts match reference counts (or no reference counts), False if otherwise.
+    """
+    all_match = True
+    print('{:<7}{:>12}{:>10}{:>10}{:>8}{:>10}{:>10}  {}'.format('DEPTH', 'LEAVES', 'WINS 1', 'WINS 2', 'TIES',
+                                                                'SECONDS', 'NPS', 'REFERENCE'))
+    for this_depth in range(1, depth + 1):
+        counts = Perft(moves).run(this_depth, workers)
+        result = (counts['leaves'], counts['wins'][1], counts['wins'][2], counts['ties'])
+        # Reference counts are known only for empty board start position.
+        reference = data.PERFT_COUNTS.get(this_depth) if not moves else None
+        if reference is None:
+            check = '-'
+        elif reference == result:
+            check = 'OK'
+        else:
+            check = 'MISMATCH {}'.format(reference)
+            all_match = False
+        print('{:<7}{:>12}{:>10}{:>10}{:>8}{:>10.2f}{:>10.0f}  {}'.format(this_depth, *result, counts['seconds'],
+                                                                          counts['nps'], check))
+    return all_match
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Counts positions reachable with Game to given depth.')
+    parser.add_argument('depth', type=int, help='max number of moves from start position')
+    parser.add_argument('--moves', default='', help='start position as columns played, e.g. 3342')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes to split root moves between')
+    args = parser.parse_args()
+    if not run_perft(args.depth, [int(col) for col in args.moves], args.workers):
+        raise SystemExit(1)
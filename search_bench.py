@@ -0,0 +1,39 @@
+from app.classes.board import Board
+from app.classes.search import Search, MoveOrder
+from app.data import game_data as data
+import sys
+
+# Move ordering variants to compare - from static center-first order only, to all heuristics.
+ORDERINGS = {
+    'static': MoveOrder(hash_move=False, killers=False, history=False),
+    'hash': MoveOrder(hash_move=True, killers=False, history=False),
+    'hash+killers': MoveOrder(hash_move=True, killers=True, history=False),
+    'all': MoveOrder(hash_move=True, killers=True, history=True),
+}
+
+
+def run_benchmark(depth):
+    """
+    Searches all benchmark positions to given depth with each move ordering variant, and prints searched nodes,
+    nodes per second and cutoff rates of each variant.
+    :param depth: (int) of search depth.
+    """
+    print('{:<14}{:>10}{:>10}{:>10}{:>10}{:>12}'.format('ORDERING', 'NODES', 'SECONDS', 'NPS', 'CUTOFFS',
+                                                        '1ST CUTOFF'))
+    for name, move_order in ORDERINGS.items():
+        search = Search(move_order)
+        for moves in data.BENCHMARK_POSITIONS:
+            # Each position is searched from scratch, so variants are compared on equal terms.
+            search.clear()
+            board = Board()
+            for col in moves:
+                board.play(col)
+            search.search(board, depth)
+        stats = search.get_stats()
+        print('{:<14}{:>10}{:>10.2f}{:>10.0f}{:>10.2f}{:>12.2f}'.format(name, stats['nodes'], stats['time'],
+                                                                        stats['nps'], stats['cutoff_rate'],
+                                                                        stats['first_cutoff_rate']))
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
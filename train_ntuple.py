@@ -0,0 +1,70 @@
+from app.classes.ntuple import NTupleEvaluator, NTupleTrainer
+from app.classes.game_batch import GameBatch
+from app.classes.seed_stream import SeedStream
+import argparse
+import numpy as np
+import os
+import time
+
+
+def train(games, path, rounds, seed):
+    """
+    Trains n-tuple weights from self-play in rounds, and saves them after each round. Prints results of each round's
+    self-play games and the trained evaluator's score against random moves.
+    :param games: (int) of number of self-play games per round.
+    :param path: (str) containing path of weights file - training continues from it if it exists.
+    :param rounds: (int) of number of rounds.
+    :param seed: (int) base seed of self-play and evaluation games. None: random base seed (printed, to replay run).
+    """
+    # Self-play and each round's evaluation get independent seeds derived from the base seed.
+    seeds = SeedStream(seed)
+    print('Base seed: {}'.format(seeds.get_seed()))
+    evaluator = NTupleEvaluator.load(path) if os.path.exists(path) else NTupleEvaluator()
+    trainer = NTupleTrainer(evaluator, seed=seeds.seed_for('self-play'))
+    print('{:<7}{:>8}{:>8}{:>8}{:>10}{:>12}'.format('ROUND', 'WINS 1', 'WINS 2', 'TIES', 'SECONDS', 'VS RANDOM'))
+    for this_round in range(1, rounds + 1):
+        start = time.perf_counter()
+        before = trainer.get_results()
+        trainer.train(games)
+        results = {key: val - before[key] for key, val in trainer.get_results().items()}
+        seconds = time.perf_counter() - start
+        evaluator.save(path)
+        score = score_vs_random(evaluator, 200, seeds.seed_for('evaluation', this_round))
+        print('{:<7}{:>8}{:>8}{:>8}{:>10.2f}{:>12.3f}'.format(this_round, results[1], results[2], results[0], seconds,
+                                                              score))
+
+
+def score_vs_random(evaluator, games, seed):
+    """
+    Plays evaluator (as player 1) against random moves (player 2).
+    :param evaluator: (NTupleEvaluator) object.
+    :param games: (int) of number of games.
+    :param seed: (int) seed for random moves. None: unseeded.
+    :return: (float) of evaluator score - 1 per win and 0.5 per tie, divided by games.
+    """
+    batch = GameBatch(games, first_player=1, seed=seed)
+    rng = np.random.default_rng(seed)
+    while np.any(batch.get_winners() == GameBatch.ONGOING):
+        ongoing = np.flatnonzero(batch.get_winners() == GameBatch.ONGOING)
+        # All games start with player 1, so all ongoing games have the same current player.
+        if batch.get_current_players()[ongoing[0]] == 1:
+            cols = np.zeros(games, dtype=np.int8)
+            for idx in ongoing:
+                cells = batch.get_boards()[idx].ravel().copy()
+                heights = list(np.count_nonzero(batch.get_boards()[idx], axis=0))
+                cols[idx] = evaluator.choose_move(cells, heights, 1, rng)
+        else:
+            cols = batch.random_moves()
+        batch.make_moves(cols)
+    winners = batch.get_winners()
+    return float(np.mean((winners == 1) + 0.5 * (winners == 0)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Trains n-tuple evaluator weights from self-play.')
+    parser.add_argument('path', help='weights file (.npy) to create or continue training')
+    parser.add_argument('--games', type=int, default=1000, help='self-play games per round')
+    parser.add_argument('--rounds', type=int, default=10, help='number of rounds')
+    parser.add_argument('--seed', type=int, default=None, help='base seed for self-play and evaluation')
+    args = parser.parse_args()
+    train(args.games, args.path, args.rounds, args.seed)